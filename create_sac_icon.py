@@ -1,69 +1,130 @@
 """
 Create SAC (Sony Automator Controls) icon for the application.
 Generates both .ico and .png versions.
+
+Works with Pillow or the drop-in pillow-simd fork (faster rasterizing/resizing).
 """
-from PIL import Image, ImageDraw, ImageFont
+import hashlib
+import inspect
+import io
+import os
+from PIL import Image, ImageDraw
 from pathlib import Path
 
 
-def create_sac_icon(size=256):
-    """Create SAC icon with concentric circles and lines to S, A, C."""
-    # Create image with dark background matching app theme
-    image = Image.new('RGBA', (size, size), (26, 26, 26, 255))
-    dc = ImageDraw.Draw(image)
+ICON_SIZES = (16, 32, 48, 64, 128, 256)
+BACKGROUND = (26, 26, 26, 255)  # Dark background matching app theme #1a1a1a
+TEAL = (0, 188, 212, 255)  # Teal accent color #00bcd4
+
 
+def _geometry(size):
+    """Return the size-dependent measurements used to draw the icon.
+
+    Pure integer math (percent of size) so every value is exact for a given size.
+    """
+    return {
+        "rings": [size * pct // 100 for pct in (35, 24, 13)],
+        "outer": size * 35 // 100,
+        "s_tip": size * 5 // 100,
+        "a_tip": size * 8 // 100,
+        "check": size * 8 // 100,
+        "line_width": max(2, size // 32),
+    }
+
+
+def _draw(dc, size, g):
+    """Draw the SAC mark onto dc using the measurements in g."""
     cx, cy = size // 2, size // 2
-    color = (0, 188, 212, 255)  # Teal accent color #00bcd4
-    line_width = max(2, size // 32)
+    color = TEAL
+    line_width = g["line_width"]
 
     # Draw concentric circles (matching Singular Controls style)
-    for radius_factor in [0.35, 0.24, 0.13]:
-        r = int(size * radius_factor)
+    for r in g["rings"]:
         dc.ellipse([cx-r, cy-r, cx+r, cy+r], outline=color, width=line_width)
 
     # Draw lines to S, A, C letter positions
-    outer_r = int(size * 0.35)
+    outer_r = g["outer"]
 
     # Line to S (top)
-    dc.line([(cx, cy - outer_r), (cx, int(size * 0.05))], fill=color, width=line_width)
+    dc.line([(cx, cy - outer_r), (cx, g["s_tip"])], fill=color, width=line_width)
 
     # Line to A (bottom-left)
-    dc.line([(cx - 4, cy + outer_r - 2), (int(size * 0.08), size - int(size * 0.08))], fill=color, width=line_width)
+    dc.line([(cx - 4, cy + outer_r - 2), (g["a_tip"], size - g["a_tip"])], fill=color, width=line_width)
 
     # Line to C (right)
-    dc.line([(cx + outer_r, cy), (size - int(size * 0.05), cy)], fill=color, width=line_width)
+    dc.line([(cx + outer_r, cy), (size - g["s_tip"], cy)], fill=color, width=line_width)
 
     # Draw small checkmark in center (quality/verified symbol)
-    check_size = int(size * 0.08)
+    check_size = g["check"]
     dc.line([(cx - check_size, cy), (cx - 2, cy + check_size//2)], fill=color, width=line_width)
     dc.line([(cx - 2, cy + check_size//2), (cx + check_size, cy - check_size//2)], fill=color, width=line_width)
 
+
+def create_sac_icon(size=256):
+    """Create SAC icon with concentric circles and lines to S, A, C."""
+    image = Image.new('RGBA', (size, size), BACKGROUND)
+    _draw(ImageDraw.Draw(image), size, _geometry(size))
     return image
 
 
+def _write_atomic(path, data):
+    """Write bytes to a sibling temp file and swap it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 def main():
     """Generate icon files."""
     output_dir = Path(__file__).parent / "static"
     output_dir.mkdir(exist_ok=True)
-
-    # Generate high-res PNG
-    print("Creating high-res SAC icon (256x256)...")
-    icon_256 = create_sac_icon(256)
-    icon_256.save(output_dir / "sac_icon.png")
-    print(f"[OK] Saved: {output_dir / 'sac_icon.png'}")
-
-    # Generate multi-resolution ICO file
-    print("\nCreating multi-resolution ICO file...")
-    sizes = [16, 32, 48, 64, 128, 256]
-    icons = [create_sac_icon(s) for s in sizes]
-
+    png_path = output_dir / "sac_icon.png"
     ico_path = output_dir / "sac_icon.ico"
-    icons[0].save(
-        ico_path,
-        format='ICO',
-        sizes=[(s, s) for s in sizes],
-        append_images=icons[1:]
-    )
+    sizes = list(ICON_SIZES)
+
+    # Reuse previous output when neither the drawing code nor the sizes changed.
+    # Kept under build/, not static/, so the cache isn't bundled into the exe
+    cache_dir = Path(__file__).parent / "build" / "icon_cache"
+    source = "".join(inspect.getsource(f) for f in (_geometry, _draw, create_sac_icon))
+    key = hashlib.sha256(source.encode() + repr((sizes, BACKGROUND, TEAL)).encode()).hexdigest()
+    cached_png = cache_dir / f"{key}.png"
+    cached_ico = cache_dir / f"{key}.ico"
+
+    if cached_png.exists() and cached_ico.exists():
+        print("Icon source unchanged, using cached render...")
+        png_bytes = cached_png.read_bytes()
+        ico_bytes = cached_ico.read_bytes()
+    else:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Only the current render is worth keeping; leave anything this script didn't write
+        for stale in (*cache_dir.glob("*.png"), *cache_dir.glob("*.ico")):
+            if len(stale.stem) == len(key) and all(c in "0123456789abcdef" for c in stale.stem):
+                stale.unlink()
+
+        # Generate high-res PNG
+        print("Creating high-res SAC icon (256x256)...")
+        icon_256 = create_sac_icon(256)
+        buf = io.BytesIO()
+        icon_256.save(buf, format='PNG')
+        png_bytes = buf.getvalue()
+
+        # Generate multi-resolution ICO file
+        # Pillow's ICO encoder downscales the 256px render for each smaller entry
+        print("\nCreating multi-resolution ICO file...")
+        buf = io.BytesIO()
+        icon_256.save(
+            buf,
+            format='ICO',
+            sizes=[(s, s) for s in sizes]
+        )
+        ico_bytes = buf.getvalue()
+
+        _write_atomic(cached_png, png_bytes)
+        _write_atomic(cached_ico, ico_bytes)
+
+    _write_atomic(png_path, png_bytes)
+    print(f"[OK] Saved: {png_path}")
+    _write_atomic(ico_path, ico_bytes)
     print(f"[OK] Saved: {ico_path}")
     print(f"  Contains sizes: {', '.join(f'{s}x{s}' for s in sizes)}")
 
@@ -1,20 +1,29 @@
 """Core application logic for Sony Automator Controls."""
 
 import asyncio
-import json
+import functools
+import hashlib
+import io
+import itertools
 import logging
 import os
+import re
 import sys
+import threading
 import time
 from datetime import datetime
+from html import escape
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from urllib.parse import quote
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Any
 from contextlib import asynccontextmanager
 
-import requests
 import httpx
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -43,36 +52,109 @@ def _setup_logging():
 _log_file_path = _setup_logging()
 logger = logging.getLogger(__name__)
 
+# Use uvloop's libuv-based event loop where available (not on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Version
 from sony_automator_controls import __version__
 
 # Global state
 tcp_servers: Dict[int, asyncio.Server] = {}
-tcp_connections: Dict[int, List[tuple]] = {}
+tcp_connections: Dict[int, Dict[Any, float]] = {}  # port -> {peer address: connected at}
 automator_status = {"connected": False, "last_check": None, "error": None}
 config_data = {}
 server_start_time = time.time()
 
 # Command/Event logging
-COMMAND_LOG: List[str] = []
 MAX_LOG_ENTRIES = 200
+COMMAND_LOG: Deque[str] = deque(maxlen=MAX_LOG_ENTRIES)
+_log_ts_second = 0  # Epoch second of the cached timestamp below
+_log_ts_text = ""
+_log_seq = 0  # Bumped on every change to COMMAND_LOG
+
+# Dashboard event log markup, re-rendered only after the log changes
+DASHBOARD_LOG_ENTRIES = 20
+_event_log_html = ""
+_event_log_html_seq = -1
+
+# /logs/view reads back from the end of the file, sized at this many bytes per line
+LOG_TAIL_LINE_ESTIMATE = 512
+# Running line count for the log: ((st_dev, st_ino), bytes counted, newlines, last bytes counted)
+LOG_COUNT_MARKER = 64
+_log_line_count: Optional[Tuple[Tuple[int, int], int, int, bytes]] = None
+
+# TCP framing: commands are newline-terminated; cap unterminated input like readline()
+TCP_READ_SIZE = 4096
+TCP_MAX_LINE = 64 * 1024
+
+# TCP dispatch table (rebuilt whenever commands or mappings change)
+# upper-cased trigger -> (TCP command, its mapping or None), resolved ahead of time
+_tcp_dispatch: Dict[str, Tuple[dict, Optional[dict]]] = {}
+
+# Normalized Automator URLs (rebuilt whenever the Automator list changes)
+_automator_base_url: Dict[str, str] = {}  # automator_id -> "http://host:port"
+_automator_endpoints: Dict[str, Dict[str, str]] = {}  # automator_id -> item_type -> trigger URL prefix
+
+# Item ID -> type per Automator, built on first lookup and dropped whenever that cache changes
+_item_type_index: Dict[str, Dict[str, str]] = {}
 
 # TCP Capture state
 tcp_capture_active = False
 tcp_capture_result = None
+_capture_changed: Optional[asyncio.Event] = None  # Set when a capture completes or is cancelled
+CAPTURE_MAX_WAIT = 25.0  # Longest a status long-poll is held open (seconds)
+
+# Automator triggers dispatched from TCP commands (strong refs so tasks aren't GC'd mid-flight)
+_inflight_triggers: set = set()
+# Newest trigger per Automator; the next one waits for it so cues reach each Automator in order
+_trigger_tail: Dict[str, asyncio.Task] = {}
 
 # Persistent HTTP client for connection pooling (much faster than creating new client each time)
 _http_client: Optional[httpx.AsyncClient] = None
+# Status probes connect with half the usual timeout: the transport retries a failed
+# connect once, so an offline Automator still answers within the 5s request timeout
+PROBE_TIMEOUT = httpx.Timeout(5.0, connect=2.5)
 
 
 def log_event(kind: str, detail: str):
     """Log an event to the command log."""
-    ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-    line = f"[{ts}] {kind}: {detail}"
-    COMMAND_LOG.append(line)
-    if len(COMMAND_LOG) > MAX_LOG_ENTRIES:
-        del COMMAND_LOG[: len(COMMAND_LOG) - MAX_LOG_ENTRIES]
-    logger.info(f"{kind}: {detail}")
+    global _log_ts_second, _log_ts_text, _log_seq
+
+    # Bursts of events share a second, so only re-format when it ticks over
+    now = int(time.time())
+    if now != _log_ts_second:
+        _log_ts_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _log_ts_second = now
+    line = f"[{_log_ts_text}] {kind}: {detail}"
+    COMMAND_LOG.append(line)  # deque drops the oldest entry once full
+    _log_seq += 1
+    logger.info("%s: %s", kind, detail)
+
+
+def clear_events():
+    """Empty the command log."""
+    global _log_seq
+    COMMAND_LOG.clear()
+    _log_seq += 1
+
+
+def recent_events(count: int) -> List[str]:
+    """Return the newest `count` command log entries, oldest first."""
+    return list(itertools.islice(COMMAND_LOG, max(0, len(COMMAND_LOG) - count), None))
+
+
+def recent_events_html() -> str:
+    """Return the dashboard's escaped event rows, rebuilding them only when the log changed."""
+    global _event_log_html, _event_log_html_seq
+
+    if _event_log_html_seq != _log_seq:
+        _event_log_html = "".join(f"<div>{escape(event)}</div>" for event in recent_events(DASHBOARD_LOG_ENTRIES))
+        _event_log_html_seq = _log_seq
+    return _event_log_html
 
 
 def effective_port() -> int:
@@ -87,10 +169,11 @@ def _app_root() -> Path:
     return Path(__file__).parent.parent
 
 
+@functools.lru_cache(maxsize=None)
 def _runtime_version() -> str:
     """
     Try to read version from version.txt next to the app, then package version.
-    Fallback to __version__ if not present.
+    Fallback to __version__ if not present. Read once and cached.
     """
     try:
         vfile = _app_root() / "version.txt"
@@ -112,11 +195,38 @@ CONFIG_DIR = Path.home() / ".sony_automator_controls"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 AUTOMATOR_CACHE_FILE = CONFIG_DIR / "automator_cache.json"
 
+# Config writes run in executor threads (and the GUI thread); snapshots are
+# numbered so an older one never overwrites a newer one
+_config_write_lock = threading.Lock()
+_config_save_seq = itertools.count(1)
+_config_written_seq = 0
+
 # Automator data cache (persisted to disk) - now stores per Automator
 automator_data_cache: Dict[str, Any] = {
     # Structure: {"automator_id": {"macros": [], "buttons": [], "shortcuts": [], "last_updated": None}}
 }
 
+# Last loaded config (as JSON bytes) and the (mtime, size) stamp of the file it came from
+_config_cache: Optional[tuple] = None
+
+# Rendered pages that depend only on config and cached Automator data, keyed by
+# (data version, page, extra key); the version is bumped whenever either changes
+_data_version = 0
+_page_cache: Dict[tuple, str] = {}
+
+# Debounced cache persistence: merges mark the cache dirty, one delayed task writes it
+CACHE_SAVE_DELAY = 0.5
+_cache_dirty = False
+_cache_save_task: Optional[asyncio.Task] = None
+
+# Automator connection status: page renders reuse a recent probe, a background task keeps it fresh
+CONNECTION_REFRESH_INTERVAL = 10.0
+# Longer than a refresh cycle plus a slow probe, so renders between refreshes use the cache
+CONNECTION_STATUS_TTL = CONNECTION_REFRESH_INTERVAL + 5.0
+_conn_status_cache: Dict[str, Tuple[float, dict]] = {}  # automator_id -> (monotonic time, status)
+_conn_refresh_task: Optional[asyncio.Task] = None
+_refresh_in_flight: Dict[str, asyncio.Task] = {}  # automator_id -> running forced refresh
+
 # Default configuration (v1.1.0 with multi-Automator support)
 DEFAULT_CONFIG = {
     "version": __version__,
@@ -164,6 +274,7 @@ class CommandMapping(BaseModel):
 class ConfigUpdate(BaseModel):
     tcp_listeners: Optional[List[TCPListener]] = None
     tcp_commands: Optional[List[TCPCommand]] = None
+    update_tcp_command: Optional[TCPCommand] = None  # Replace one command by ID
     automators: Optional[List[AutomatorConfig]] = None  # Updated: now list
     command_mappings: Optional[List[CommandMapping]] = None
     web_port: Optional[int] = None
@@ -176,6 +287,23 @@ class SettingsIn(BaseModel):
     first_run: Optional[bool] = None
 
 
+# Rendered page cache
+def _bump_data_version():
+    """Invalidate cached pages after config or cached Automator data changes."""
+    global _data_version
+    _data_version += 1
+    _page_cache.clear()
+
+
+def _page_key(*parts) -> tuple:
+    """Key a page render to the current data version.
+
+    Take the key before rendering: if data changes mid-render, the result is
+    stored under the old version and never served.
+    """
+    return (_data_version,) + parts
+
+
 # Configuration management
 def ensure_config_dir():
     """Ensure configuration directory exists."""
@@ -232,24 +360,42 @@ def migrate_config_to_v1_1_0(old_config: dict) -> dict:
 
 
 def load_config() -> dict:
-    """Load configuration from file."""
+    """Load configuration from file.
+
+    An unchanged file is not read from disk or migrated again; each call still
+    parses a fresh dict from the cached JSON bytes.
+    """
+    global _config_cache
+
     ensure_config_dir()
 
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                logger.info(f"Configuration loaded from {CONFIG_FILE}")
-
-                # Check if migration is needed (v1.0.x to v1.1.0)
-                config_version = config.get("config_version", "1.0.0")
-                if config_version < "1.1.0" or "automator" in config:
-                    config = migrate_config_to_v1_1_0(config)
-                    save_config(config)  # Save migrated config
-
-                return config
+            stat = CONFIG_FILE.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            # Each caller gets its own dict, so edits to one never leak into another or the cache
+            if _config_cache is not None and _config_cache[0] == stamp:
+                return orjson.loads(_config_cache[1])
+
+            # Only a changed file invalidates the rendered pages
+            _bump_data_version()
+            with open(CONFIG_FILE, 'rb') as f:
+                config = orjson.loads(f.read())
+            logger.info(f"Configuration loaded from {CONFIG_FILE}")
+
+            # Check if migration is needed (v1.0.x to v1.1.0)
+            config_version = config.get("config_version", "1.0.0")
+            if config_version < "1.1.0" or "automator" in config:
+                config = migrate_config_to_v1_1_0(config)
+                save_config(config)  # Save migrated config
+                stat = CONFIG_FILE.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+
+            _config_cache = (stamp, orjson.dumps(config))
+            return config
         except Exception as e:
             logger.error(f"Error loading config: {e}")
+            _bump_data_version()
             return DEFAULT_CONFIG.copy()
     else:
         # Create default config
@@ -257,16 +403,64 @@ def load_config() -> dict:
         return DEFAULT_CONFIG.copy()
 
 
-def save_config(config: dict):
-    """Save configuration to file."""
-    ensure_config_dir()
+def reload_config() -> dict:
+    """Reload config.json into config_data and rebuild the tables derived from it."""
+    global config_data
+    config_data = load_config()
+    _rebuild_dispatch_indexes()
+    return config_data
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write bytes to a sibling temp file and swap it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
+
+def _snapshot_config(config: dict) -> Tuple[int, Optional[bytes]]:
+    """Serialize config now and number the snapshot so writes land in order."""
+    _bump_data_version()
+    seq = next(_config_save_seq)
     try:
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
-        logger.info(f"Configuration saved to {CONFIG_FILE}")
+        return seq, orjson.dumps(config, option=orjson.OPT_INDENT_2)
     except Exception as e:
         logger.error(f"Error saving config: {e}")
+        return seq, None
+
+
+def _write_config_snapshot(seq: int, data: Optional[bytes]):
+    """Write a config snapshot unless a newer one has already been written."""
+    global _config_written_seq
+
+    if data is None:
+        return
+    with _config_write_lock:
+        if seq < _config_written_seq:
+            return
+        try:
+            ensure_config_dir()
+            # A crash mid-write leaves the previous config.json intact
+            _write_atomic(CONFIG_FILE, data)
+            _config_written_seq = seq
+            logger.info(f"Configuration saved to {CONFIG_FILE}")
+        except Exception as e:
+            logger.error(f"Error saving config: {e}")
+
+
+def save_config(config: dict):
+    """Save configuration to file."""
+    _write_config_snapshot(*_snapshot_config(config))
+
+
+async def save_config_async(config: dict):
+    """Save configuration, doing the file write in the default executor.
+
+    The snapshot is taken before returning to the loop, so later edits to
+    config are not picked up by this write.
+    """
+    seq, data = _snapshot_config(config)
+    await asyncio.get_running_loop().run_in_executor(None, _write_config_snapshot, seq, data)
 
 
 def load_automator_cache() -> dict:
@@ -277,10 +471,12 @@ def load_automator_cache() -> dict:
 
     if AUTOMATOR_CACHE_FILE.exists():
         try:
-            with open(AUTOMATOR_CACHE_FILE, 'r', encoding='utf-8') as f:
-                automator_data_cache = json.load(f)
-                logger.info(f"Automator cache loaded from {AUTOMATOR_CACHE_FILE}")
-                return automator_data_cache
+            with open(AUTOMATOR_CACHE_FILE, 'rb') as f:
+                automator_data_cache = orjson.loads(f.read())
+            _item_type_index.clear()
+            _bump_data_version()
+            logger.info(f"Automator cache loaded from {AUTOMATOR_CACHE_FILE}")
+            return automator_data_cache
         except Exception as e:
             logger.error(f"Error loading Automator cache: {e}")
 
@@ -289,18 +485,57 @@ def load_automator_cache() -> dict:
 
 def save_automator_cache():
     """Save Automator data cache to disk (now per-Automator structure)."""
-    global automator_data_cache
+    global automator_data_cache, _cache_dirty
 
     ensure_config_dir()
+    _cache_dirty = False
 
     try:
-        with open(AUTOMATOR_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(automator_data_cache, f, indent=2)
+        with open(AUTOMATOR_CACHE_FILE, 'wb') as f:
+            f.write(orjson.dumps(automator_data_cache, option=orjson.OPT_INDENT_2))
         logger.info(f"Automator cache saved to {AUTOMATOR_CACHE_FILE}")
     except Exception as e:
         logger.error(f"Error saving Automator cache: {e}")
 
 
+def _schedule_cache_save():
+    """Mark the cache dirty and write it once after CACHE_SAVE_DELAY."""
+    global _cache_dirty, _cache_save_task
+
+    _cache_dirty = True
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop (e.g. called from a script) - write straight away
+        save_automator_cache()
+        return
+
+    if _cache_save_task is None or _cache_save_task.done():
+        _cache_save_task = loop.create_task(_debounced_cache_save())
+
+
+async def _debounced_cache_save():
+    """Wait for merges to settle, then persist the cache off the event loop."""
+    await asyncio.sleep(CACHE_SAVE_DELAY)
+    loop = asyncio.get_running_loop()
+    # Repeat if another merge lands while the previous write is in progress
+    while _cache_dirty:
+        await loop.run_in_executor(None, save_automator_cache)
+
+
+async def flush_automator_cache():
+    """Write any pending cache changes now (used on shutdown)."""
+    global _cache_save_task
+
+    # Let a scheduled save finish rather than racing it with a second writer
+    if _cache_save_task is not None:
+        await _cache_save_task
+        _cache_save_task = None
+
+    if _cache_dirty:
+        await asyncio.get_running_loop().run_in_executor(None, save_automator_cache)
+
+
 def get_automator_cache(automator_id: str) -> dict:
     """Get cache for a specific Automator."""
     global automator_data_cache
@@ -329,24 +564,18 @@ def merge_automator_data(automator_id: str, new_data: dict):
 
     for key in ["macros", "buttons", "shortcuts"]:
         if key in new_data:
-            existing_items = {item.get("id"): item for item in cache.get(key, [])}
-            new_items = {item.get("id"): item for item in new_data.get(key, [])}
-
-            # Merge: update existing, add new
-            merged = {}
-            for item_id, item in new_items.items():
-                if item_id in existing_items:
-                    # Update existing item
-                    merged[item_id] = item
-                else:
-                    # Add new item
-                    merged[item_id] = item
-
-            cache[key] = list(merged.values())
+            # Fresh data is authoritative: keep one entry per ID, drop IDs no longer present
+            items = new_data[key]
+            cache[key] = list({item["id"]: item for item in items if "id" in item}.values())
+            dropped = sum(1 for item in items if "id" not in item)
+            if dropped:
+                logger.warning("Dropped %d Automator %s without an ID", dropped, key)
 
     cache["last_updated"] = datetime.now().isoformat()
     automator_data_cache[automator_id] = cache
-    save_automator_cache()
+    _item_type_index.pop(automator_id, None)
+    _bump_data_version()
+    _schedule_cache_save()
 
 
 def get_automator_by_id(automator_id: str) -> Optional[dict]:
@@ -367,51 +596,117 @@ def get_all_automators() -> List[dict]:
     return config_data.get("automators", [])
 
 
+def _normalize_automator_url(url: str) -> str:
+    """Return the Automator URL with a protocol and no trailing slash ("" if unset)."""
+    url = (url or "").strip()
+    if not url:
+        return ""
+
+    # Ensure URL has protocol
+    if not url.startswith('http://') and not url.startswith('https://'):
+        url = f"http://{url}"
+
+    return url.rstrip("/")
+
+
+def _rebuild_dispatch_indexes():
+    """Rebuild the TCP trigger, mapping and Automator URL lookup tables from config_data."""
+    global _tcp_dispatch, _automator_base_url, _automator_endpoints
+
+    # First definition wins, matching the order of a linear scan
+    mapping_index = {}
+    for m in config_data.get("command_mappings", []):
+        mapping_index.setdefault(m["tcp_command_id"], m)
+
+    dispatch = {}
+    for cmd in config_data.get("tcp_commands", []):
+        dispatch.setdefault(cmd["tcp_trigger"].upper(), (cmd, mapping_index.get(cmd["id"])))
+
+    base_urls = {}
+    endpoints = {}
+    for automator in config_data.get("automators", []):
+        url = _normalize_automator_url(automator.get("url", ""))
+        if url:
+            base_urls[automator["id"]] = url
+            endpoints[automator["id"]] = {
+                "macro": f"{url}/api/macro/",
+                "button": f"{url}/api/trigger/button/",
+                "shortcut": f"{url}/api/trigger/shortcut/",
+            }
+
+    _tcp_dispatch = dispatch
+    _automator_base_url = base_urls
+    _automator_endpoints = endpoints
+
+    # Cached connection statuses may belong to old URLs
+    _conn_status_cache.clear()
+
+
 # TCP Server implementation
 async def handle_tcp_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, port: int):
-    """Handle individual TCP client connection."""
-    global tcp_capture_active, tcp_capture_result
-
+    """Handle individual TCP client connection (newline-framed commands)."""
     addr = writer.get_extra_info('peername')
-    logger.debug(f"TCP client connected from {addr} on port {port}")
+    logger.debug("TCP client connected from %s on port %s", addr, port)
 
     # Track connection
-    if port not in tcp_connections:
-        tcp_connections[port] = []
-    tcp_connections[port].append((addr, time.time()))
+    tcp_connections.setdefault(port, {})[addr] = time.time()
 
     try:
+        buf = bytearray()
         while True:
-            data = await reader.readline()
-            if not data:
+            chunk = await reader.read(TCP_READ_SIZE)
+            if not chunk:
+                # Client closed - a final command without a newline still counts
+                if buf:
+                    await handle_tcp_message(bytes(buf), port, addr)
                 break
+            buf += chunk
 
-            message = data.decode().strip()
-            # Only log received command, not duplicate info
-            logger.debug(f"Received TCP command on port {port}: {message}")
+            # Dispatch every complete line in the buffer
+            start = 0
+            nl = buf.find(b"\n")
+            while nl != -1:
+                await handle_tcp_message(bytes(buf[start:nl]), port, addr)
+                start = nl + 1
+                nl = buf.find(b"\n", start)
+            del buf[:start]
 
-            # If capture mode is active, store the command
-            if tcp_capture_active:
-                tcp_capture_result = {
-                    "command": message,
-                    "port": port,
-                    "source": str(addr)
-                }
-                log_event("TCP Capture", f"Captured command '{message}' from port {port}")
-                tcp_capture_active = False  # Disable capture after first command
-
-            # Process the command
-            await process_tcp_command(message, port)
+            if len(buf) > TCP_MAX_LINE:
+                raise ValueError(f"Command exceeds {TCP_MAX_LINE} bytes without a newline")
 
     except Exception as e:
         logger.error(f"Error handling TCP client {addr}: {e}")
     finally:
-        logger.debug(f"TCP client disconnected: {addr}")
-        tcp_connections[port] = [conn for conn in tcp_connections[port] if conn[0] != addr]
+        logger.debug("TCP client disconnected: %s", addr)
+        tcp_connections.get(port, {}).pop(addr, None)
         writer.close()
         await writer.wait_closed()
 
 
+async def handle_tcp_message(data: bytes, port: int, addr: Any):
+    """Decode one framed TCP command, feed TCP capture, and dispatch it."""
+    global tcp_capture_active, tcp_capture_result
+
+    message = data.strip().decode("utf-8", "replace")
+    # Only log received command, not duplicate info
+    logger.debug("Received TCP command on port %s: %s", port, message)
+
+    # If capture mode is active, store the command
+    if tcp_capture_active:
+        tcp_capture_result = {
+            "command": message,
+            "port": port,
+            "source": str(addr)
+        }
+        log_event("TCP Capture", f"Captured command '{message}' from port {port}")
+        tcp_capture_active = False  # Disable capture after first command
+        if _capture_changed:
+            _capture_changed.set()
+
+    # Process the command
+    await process_tcp_command(message, port)
+
+
 async def process_tcp_command(command: str, port: int):
     """Process incoming TCP command and trigger corresponding HTTP action."""
     global config_data
@@ -419,23 +714,14 @@ async def process_tcp_command(command: str, port: int):
     # Single log event for command received
     log_event("TCP Command", f"Received '{command}' on port {port}")
 
-    # Find matching TCP command in config
-    tcp_cmd = None
-    for cmd in config_data.get("tcp_commands", []):
-        if cmd["tcp_trigger"].upper() == command.upper():
-            tcp_cmd = cmd
-            break
+    # Find matching TCP command and its mapping in one lookup
+    entry = _tcp_dispatch.get(command.upper())
 
-    if not tcp_cmd:
+    if not entry:
         log_event("TCP Warning", f"No definition for command '{command}'")
         return
 
-    # Find command mapping
-    mapping = None
-    for m in config_data.get("command_mappings", []):
-        if m["tcp_command_id"] == tcp_cmd["id"]:
-            mapping = m
-            break
+    tcp_cmd, mapping = entry
 
     if not mapping:
         log_event("TCP Warning", f"No mapping for '{tcp_cmd['name']}'")
@@ -455,16 +741,35 @@ async def process_tcp_command(command: str, port: int):
 
     # If type is missing from mapping (old config), try to detect it from the macro ID
     if not item_type:
-        macros = fetch_automator_macros(automator_id)
-        for macro in macros:
-            if macro.get("id") == mapping["automator_macro_id"]:
-                item_type = macro.get("type", "macro")
-                logger.debug(f"Auto-detected type '{item_type}' for {mapping['automator_macro_name']}")
-                break
-        if not item_type:
+        item_type = _cached_item_type(automator_id, mapping["automator_macro_id"])
+        if item_type:
+            logger.debug("Auto-detected type '%s' for %s", item_type, mapping['automator_macro_name'])
+        else:
             item_type = "macro"  # Final fallback
 
-    await trigger_automator_macro(mapping["automator_macro_id"], mapping["automator_macro_name"], item_type, automator_id)
+    # Fire the trigger in the background so the client's next command is read immediately,
+    # chained behind the previous trigger for the same Automator to keep cues in order
+    task = asyncio.create_task(_trigger_in_order(
+        _trigger_tail.get(automator_id),
+        mapping["automator_macro_id"], mapping["automator_macro_name"], item_type, automator_id
+    ))
+    _trigger_tail[automator_id] = task
+    _inflight_triggers.add(task)
+    task.add_done_callback(_inflight_triggers.discard)
+    task.add_done_callback(functools.partial(_release_trigger_tail, automator_id))
+
+
+async def _trigger_in_order(previous: Optional[asyncio.Task], macro_id: str, macro_name: str, item_type: str, automator_id: str):
+    """Trigger an Automator item once the previous trigger for that Automator has finished."""
+    if previous is not None and not previous.done():
+        await asyncio.wait({previous})
+    await trigger_automator_macro(macro_id, macro_name, item_type, automator_id)
+
+
+def _release_trigger_tail(automator_id: str, task: asyncio.Task):
+    """Forget the finished trigger unless a newer one has been chained behind it."""
+    if _trigger_tail.get(automator_id) is task:
+        del _trigger_tail[automator_id]
 
 
 def _get_http_client() -> httpx.AsyncClient:
@@ -473,12 +778,34 @@ def _get_http_client() -> httpx.AsyncClient:
     if _http_client is None:
         _http_client = httpx.AsyncClient(
             timeout=5.0,
-            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
-            http2=False  # HTTP/1.1 is faster for simple requests
+            # An explicit transport ignores client-level limits, so the pool is configured here.
+            # Keep idle sockets to each Automator alive between show cues
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=300.0),
+            ),
+            http2=False  # HTTP/1.1 is faster for simple requests (Automator is plain http://)
         )
     return _http_client
 
 
+async def _refresh_automator_status():
+    """Probe every enabled Automator periodically.
+
+    Keeps the connection status cache fresh for page renders and the HTTP pool
+    warm ahead of the first trigger.
+    """
+    while True:
+        try:
+            automators = [a for a in get_all_automators() if a.get("enabled") and a.get("url")]
+            if automators:
+                await asyncio.gather(*(check_automator_connection(a["id"], max_age=0) for a in automators))
+        except Exception as e:
+            # One bad probe must not stop the refresh for good
+            logger.error(f"Error refreshing Automator status: {e}")
+        await asyncio.sleep(CONNECTION_REFRESH_INTERVAL)
+
+
 async def trigger_automator_macro(macro_id: str, macro_name: str, item_type: str = "macro", automator_id: Optional[str] = None):
     """Trigger an Automator macro, button, or shortcut via HTTP."""
     global config_data
@@ -506,26 +833,15 @@ async def trigger_automator_macro(macro_id: str, macro_name: str, item_type: str
         logger.warning(f"Automator {automator_config['name']} is disabled")
         return
 
-    url = automator_config.get("url", "").strip()
+    prefixes = _automator_endpoints.get(automator_config["id"])
 
-    if not url:
+    if not prefixes:
         log_event("Automator Error", f"{automator_config['name']} URL not configured")
         logger.error(f"Automator {automator_config['name']} URL not configured")
         return
 
-    # Ensure URL has protocol
-    if not url.startswith('http://') and not url.startswith('https://'):
-        url = f"http://{url}"
-
-    url = url.rstrip("/")
-
-    # Construct HTTP request based on type
-    if item_type == "button":
-        endpoint = f"{url}/api/trigger/button/{macro_id}"
-    elif item_type == "shortcut":
-        endpoint = f"{url}/api/trigger/shortcut/{macro_id}"
-    else:  # macro
-        endpoint = f"{url}/api/macro/{macro_id}"
+    # Construct HTTP request based on type (anything unknown is a macro)
+    endpoint = prefixes.get(item_type, prefixes["macro"]) + macro_id
 
     try:
         # Single log event for trigger attempt
@@ -537,7 +853,7 @@ async def trigger_automator_macro(macro_id: str, macro_name: str, item_type: str
         response.raise_for_status()
 
         log_event("HTTP Success", f"[{automator_config['name']}] Triggered {item_type}: {macro_name}")
-    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+    except (httpx.RequestError, httpx.HTTPStatusError, httpx.InvalidURL) as e:
         log_event("HTTP Error", f"[{automator_config['name']}] Failed to trigger {macro_name}: {str(e)}")
         logger.error(f"Error triggering Automator {item_type} {macro_name} on {automator_config['name']}: {e}")
 
@@ -558,7 +874,7 @@ async def start_tcp_server(port: int):
             port
         )
         tcp_servers[port] = server
-        tcp_connections[port] = []
+        tcp_connections[port] = {}
         log_event("TCP Server", f"Started on port {port}")
         logger.info(f"TCP server started on port {port}")
 
@@ -608,8 +924,11 @@ async def restart_tcp_servers():
             await start_tcp_server(listener["port"])
 
 
-def check_automator_connection(automator_id: Optional[str] = None) -> dict:
-    """Check connection to Automator API (specific Automator by ID)."""
+async def check_automator_connection(automator_id: Optional[str] = None, max_age: float = CONNECTION_STATUS_TTL) -> dict:
+    """Check connection to Automator API (specific Automator by ID).
+
+    A status probed within the last max_age seconds is returned without a new request.
+    """
     global config_data
 
     # Get Automator config
@@ -626,7 +945,9 @@ def check_automator_connection(automator_id: Optional[str] = None) -> dict:
     if not automator_config:
         return {"connected": False, "last_check": datetime.now().isoformat(), "error": "Automator not found"}
 
-    if not automator_config.get("enabled") or not automator_config.get("url"):
+    url = _automator_base_url.get(automator_config["id"])
+
+    if not automator_config.get("enabled") or not url:
         return {
             "connected": False,
             "last_check": datetime.now().isoformat(),
@@ -635,16 +956,42 @@ def check_automator_connection(automator_id: Optional[str] = None) -> dict:
             "automator_name": automator_config["name"]
         }
 
-    url = automator_config.get("url", "").strip()
+    cached = _conn_status_cache.get(automator_config["id"])
+    if cached and time.monotonic() - cached[0] < max_age:
+        return cached[1]
 
-    # Ensure URL has protocol
-    if url and not url.startswith('http://') and not url.startswith('https://'):
-        url = f"http://{url}"
+    status = await _probe_automator(automator_config, url)
+    _conn_status_cache[automator_config["id"]] = (time.monotonic(), status)
+    return status
+
+
+async def _automator_statuses(automators: List[dict]) -> Dict[str, dict]:
+    """Check every Automator concurrently and return {automator_id: status}."""
+    results = await asyncio.gather(
+        *(check_automator_connection(a["id"]) for a in automators),
+        return_exceptions=True
+    )
+    statuses = {}
+    for automator, status in zip(automators, results):
+        if isinstance(status, Exception):
+            # One failing probe shows as disconnected instead of failing the whole page
+            logger.error(f"Error checking Automator {automator['name']}: {status}")
+            status = {
+                "connected": False,
+                "last_check": datetime.now().isoformat(),
+                "error": str(status)[:100],
+                "automator_id": automator["id"],
+                "automator_name": automator["name"]
+            }
+        statuses[automator["id"]] = status
+    return statuses
 
-    url = url.rstrip("/")
 
+async def _probe_automator(automator_config: dict, url: str) -> dict:
+    """Request the Automator's web connection endpoint and describe the result."""
     try:
-        response = requests.get(f"{url}/api/app/webconnection", timeout=5)
+        client = _get_http_client()
+        response = await client.get(f"{url}/api/app/webconnection", timeout=PROBE_TIMEOUT)
         response.raise_for_status()
         return {
             "connected": True,
@@ -653,7 +1000,7 @@ def check_automator_connection(automator_id: Optional[str] = None) -> dict:
             "automator_id": automator_config["id"],
             "automator_name": automator_config["name"]
         }
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         return {
             "connected": False,
             "last_check": datetime.now().isoformat(),
@@ -661,7 +1008,7 @@ def check_automator_connection(automator_id: Optional[str] = None) -> dict:
             "automator_id": automator_config["id"],
             "automator_name": automator_config["name"]
         }
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         return {
             "connected": False,
             "last_check": datetime.now().isoformat(),
@@ -669,7 +1016,7 @@ def check_automator_connection(automator_id: Optional[str] = None) -> dict:
             "automator_id": automator_config["id"],
             "automator_name": automator_config["name"]
         }
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         return {
             "connected": False,
             "last_check": datetime.now().isoformat(),
@@ -677,7 +1024,15 @@ def check_automator_connection(automator_id: Optional[str] = None) -> dict:
             "automator_id": automator_config["id"],
             "automator_name": automator_config["name"]
         }
-    except requests.exceptions.RequestException as e:
+    except httpx.InvalidURL as e:
+        return {
+            "connected": False,
+            "last_check": datetime.now().isoformat(),
+            "error": f"Invalid URL: {e}"[:100],
+            "automator_id": automator_config["id"],
+            "automator_name": automator_config["name"]
+        }
+    except httpx.RequestError as e:
         error_msg = str(e).split("(")[0].strip() if "(" in str(e) else str(e)
         return {
             "connected": False,
@@ -688,7 +1043,7 @@ def check_automator_connection(automator_id: Optional[str] = None) -> dict:
         }
 
 
-def fetch_automator_macros(automator_id: Optional[str] = None, force_refresh: bool = False, use_cache_on_failure: bool = True) -> List[Dict[str, Any]]:
+async def fetch_automator_macros(automator_id: Optional[str] = None, force_refresh: bool = False, use_cache_on_failure: bool = True) -> List[Dict[str, Any]]:
     """
     Fetch macros, buttons, and shortcuts from Automator API.
 
@@ -723,116 +1078,126 @@ def fetch_automator_macros(automator_id: Optional[str] = None, force_refresh: bo
 
     # If not forcing refresh, just return cache (fast!)
     if not force_refresh:
-        logger.debug(f"Using cached Automator data for {automator_config['name']} (no refresh requested)")
+        logger.debug("Using cached Automator data for %s (no refresh requested)", automator_config['name'])
         return _get_cached_items(automator_config["id"])
 
-    url = automator_config.get("url", "").strip()
+    url = _automator_base_url.get(automator_config["id"])
 
     # If no URL configured, return cached data
     if not url:
         logger.info(f"No URL for Automator {automator_config['name']}, using cached data")
         return _get_cached_items(automator_config["id"])
 
-    # Ensure URL has protocol
-    if url and not url.startswith('http://') and not url.startswith('https://'):
-        url = f"http://{url}"
+    # Concurrent refreshes of the same Automator share one upstream fetch
+    task = _refresh_in_flight.get(automator_config["id"])
+    if task is None:
+        task = asyncio.ensure_future(_refresh_automator_items(automator_config, url))
+        _refresh_in_flight[automator_config["id"]] = task
+        task.add_done_callback(lambda _t, key=automator_config["id"]: _refresh_in_flight.pop(key, None))
 
-    url = url.rstrip("/")
+    if await asyncio.shield(task):
+        return _get_cached_items(automator_config["id"])
 
-    macros = []
-    buttons = []
-    shortcuts = []
-    fetch_success = False
+    # If fetch failed and we should use cache, return cached data
+    if use_cache_on_failure:
+        logger.debug("Using cached Automator data for %s (fetch failed)", automator_config['name'])
+        return _get_cached_items(automator_config["id"])
 
-    # Fetch macros
-    try:
-        response = requests.get(f"{url}/api/macro/", timeout=5)
-        response.raise_for_status()
-        macros = response.json()
-        logger.info(f"Fetched {len(macros)} macros from Automator")
-        fetch_success = True
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error fetching Automator macros: {e}")
+    return []
 
-    # Fetch buttons
-    try:
-        response = requests.get(f"{url}/api/trigger/button/", timeout=5)
-        response.raise_for_status()
-        buttons = response.json()
-        logger.info(f"Fetched {len(buttons)} buttons from Automator")
-        fetch_success = True
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error fetching Automator buttons: {e}")
 
-    # Fetch shortcuts
-    try:
-        response = requests.get(f"{url}/api/trigger/shortcut/", timeout=5)
-        response.raise_for_status()
-        shortcuts = response.json()
-        logger.info(f"Fetched {len(shortcuts)} shortcuts from Automator")
+async def _refresh_automator_items(automator_config: dict, url: str) -> bool:
+    """Fetch an Automator's items and merge them into the cache; True if any list loaded."""
+    # Fetch macros, buttons and shortcuts concurrently over the shared client
+    client = _get_http_client()
+    macros_r, buttons_r, shortcuts_r = await asyncio.gather(
+        client.get(f"{url}/api/macro/"),
+        client.get(f"{url}/api/trigger/button/"),
+        client.get(f"{url}/api/trigger/shortcut/"),
+        return_exceptions=True
+    )
 
-        # Add type and title to shortcuts (they don't have these fields in the API)
-        for shortcut in shortcuts:
-            shortcut["type"] = "shortcut"
+    macros = _response_items(macros_r, "macros")
+    buttons = _response_items(buttons_r, "buttons")
+    shortcuts = _response_items(shortcuts_r, "shortcuts")
+    fetch_success = any(items is not None for items in (macros, buttons, shortcuts))
 
-            # Build display title from keyboard shortcut components
-            key_parts = []
-            if shortcut.get("control"):
-                key_parts.append("Ctrl")
-            if shortcut.get("alt"):
-                key_parts.append("Alt")
-            if shortcut.get("shift"):
-                key_parts.append("Shift")
-            key_parts.append(shortcut.get("key", "Unknown"))
+    # Add type and title to shortcuts (they don't have these fields in the API)
+    for shortcut in shortcuts or []:
+        shortcut["type"] = "shortcut"
 
-            shortcut["title"] = " + ".join(key_parts)
+        # Build display title from keyboard shortcut components
+        key_parts = []
+        if shortcut.get("control"):
+            key_parts.append("Ctrl")
+        if shortcut.get("alt"):
+            key_parts.append("Alt")
+        if shortcut.get("shift"):
+            key_parts.append("Shift")
+        key_parts.append(shortcut.get("key", "Unknown"))
 
-        fetch_success = True
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error fetching Automator shortcuts: {e}")
+        shortcut["title"] = " + ".join(key_parts)
 
     # If we successfully fetched any data, merge with cache
     if fetch_success:
         new_data = {
-            "macros": macros,
-            "buttons": buttons,
-            "shortcuts": shortcuts
+            "macros": macros or [],
+            "buttons": buttons or [],
+            "shortcuts": shortcuts or []
         }
         merge_automator_data(automator_config["id"], new_data)
         logger.info(f"Merged new Automator data for {automator_config['name']} with cache")
-        return _get_cached_items(automator_config["id"])
 
-    # If fetch failed and we should use cache, return cached data
-    if use_cache_on_failure:
-        logger.debug(f"Using cached Automator data for {automator_config['name']} (fetch failed)")
-        return _get_cached_items(automator_config["id"])
+    return fetch_success
 
-    return []
+
+def _response_items(result: Any, label: str) -> Optional[List[Dict[str, Any]]]:
+    """Return the JSON items from a gathered Automator response, or None if it failed."""
+    try:
+        if isinstance(result, BaseException):
+            raise result
+        result.raise_for_status()
+        items = result.json()
+    except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
+        logger.error(f"Error fetching Automator {label}: {e}")
+        return None
+
+    logger.info("Fetched %d %s from Automator", len(items), label)
+    return items
 
 
 def _get_cached_items(automator_id: str) -> List[Dict[str, Any]]:
     """Get all items from cache as a flat list for a specific Automator."""
     cache = get_automator_cache(automator_id)
-    all_items = []
-    all_items.extend(cache.get("macros", []))
-    all_items.extend(cache.get("buttons", []))
-    all_items.extend(cache.get("shortcuts", []))
-    return all_items
+    return [*cache.get("macros", ()), *cache.get("buttons", ()), *cache.get("shortcuts", ())]
+
+
+def _cached_item_type(automator_id: str, item_id: str) -> Optional[str]:
+    """Look up the type of a cached item by ID, or None if it isn't cached."""
+    index = _item_type_index.get(automator_id)
+    if index is None:
+        index = {}
+        # First occurrence wins, matching a scan of macros, buttons then shortcuts
+        for item in _get_cached_items(automator_id):
+            index.setdefault(item.get("id"), item.get("type", "macro"))
+        _item_type_index[automator_id] = index
+    return index.get(item_id)
 
 
 # Application lifespan
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global config_data
+    global _conn_refresh_task
 
     # Startup
     logger.info("Starting Sony Automator Controls...")
     log_event("System", f"Starting Elliott's Sony Automator Controls v{__version__}")
-    config_data = load_config()
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, reload_config)
 
     # Load cached Automator data
-    load_automator_cache()
+    await loop.run_in_executor(None, load_automator_cache)
     log_event("System", "Loaded cached Automator data")
 
     # Start TCP servers for enabled listeners
@@ -840,11 +1205,21 @@ async def lifespan(app: FastAPI):
         if listener["enabled"]:
             await start_tcp_server(listener["port"])
 
+    # Probe Automators in the background so startup isn't held up by offline ones
+    _conn_refresh_task = asyncio.create_task(_refresh_automator_status())
+
     log_event("System", "Server startup complete")
 
     yield
 
     # Shutdown
+    _conn_refresh_task.cancel()
+    await flush_automator_cache()
+
+    # Let in-flight triggers finish before the HTTP client is closed
+    if _inflight_triggers:
+        await asyncio.gather(*_inflight_triggers, return_exceptions=True)
+
     global _http_client
     if _http_client:
         await _http_client.aclose()
@@ -857,65 +1232,114 @@ async def lifespan(app: FastAPI):
         await stop_tcp_server(port)
 
 
+class _ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (compact, and much faster than the stdlib encoder)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # FastAPI app
-app = FastAPI(title="Sony Automator Controls", version=__version__, lifespan=lifespan)
+app = FastAPI(
+    title="Sony Automator Controls",
+    version=__version__,
+    lifespan=lifespan,
+    default_response_class=_ORJSONResponse,
+)
+
+# Pages and stylesheets are large, highly repetitive text; compress anything non-trivial
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+class _CachedStaticFiles(StaticFiles):
+    """Static files that let browsers keep the bundled fonts without revalidating."""
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code == 200 and path.endswith((".woff2", ".ttf")):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 
 # Mount static files
 static_dir = Path(__file__).parent.parent / "static"
 if static_dir.exists():
-    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+    app.mount("/static", _CachedStaticFiles(directory=str(static_dir)), name="static")
 
 
 # Styling functions
 def _get_base_styles() -> str:
-    """Return base CSS styles matching Elliott's Singular Control exactly."""
-    # Check theme and set colors accordingly
-    theme = config_data.get("theme", "dark")
-    if theme == "light":
-        bg = "#f0f2f5"
-        fg = "#1a1a2e"
-        card_bg = "#ffffff"
-        border = "#e0e0e0"
-        accent = "#00bcd4"
-        accent_hover = "#0097a7"
-        text_muted = "#666666"
-        input_bg = "#fafafa"
-    else:
-        # Modern dark theme - matched to desktop GUI colors
-        bg = "#1a1a1a"
-        fg = "#ffffff"
-        card_bg = "#2d2d2d"
-        border = "#3d3d3d"
-        accent = "#00bcd4"
-        accent_hover = "#0097a7"
-        text_muted = "#888888"
-        input_bg = "#252525"
-
-    return f"""
-    <style>
+    """Return the stylesheet link for the current theme.
+
+    The URL carries the app version, so browsers can cache it indefinitely.
+    """
+    theme = quote(config_data.get("theme", "dark"), safe="")
+    return f'<link rel="stylesheet" href="/styles/{quote(_runtime_version(), safe="")}/{theme}.css">'
+
+
+def _get_base_scripts() -> str:
+    """Return the script tag for the shared page script (versioned like the stylesheet)."""
+    return f'<script src="/scripts/{quote(_runtime_version(), safe="")}/app.js"></script>'
+
+
+# Theme palettes used by the base stylesheet
+_THEMES = {
+    "light": {
+        "bg": "#f0f2f5",
+        "fg": "#1a1a2e",
+        "card_bg": "#ffffff",
+        "border": "#e0e0e0",
+        "accent": "#00bcd4",
+        "accent_hover": "#0097a7",
+        "text_muted": "#666666",
+        "input_bg": "#fafafa",
+    },
+    # Modern dark theme - matched to desktop GUI colors
+    "dark": {
+        "bg": "#1a1a1a",
+        "fg": "#ffffff",
+        "card_bg": "#2d2d2d",
+        "border": "#3d3d3d",
+        "accent": "#00bcd4",
+        "accent_hover": "#0097a7",
+        "text_muted": "#888888",
+        "input_bg": "#252525",
+    },
+}
+
+
+# Base stylesheet; {name} placeholders are filled from a _THEMES palette
+_BASE_STYLES_TEMPLATE = """
         @font-face {{
             font-family: 'ITVReem';
-            src: url('/static/ITV Reem-Light.ttf') format('truetype');
+            src: url('/static/ITV Reem-Light.woff2') format('woff2'),
+                 url('/static/ITV Reem-Light.ttf') format('truetype');
             font-weight: 300;
             font-style: normal;
+            font-display: swap;
         }}
         @font-face {{
             font-family: 'ITVReem';
-            src: url('/static/ITV Reem-Regular.ttf') format('truetype');
+            src: url('/static/ITV Reem-Regular.woff2') format('woff2'),
+                 url('/static/ITV Reem-Regular.ttf') format('truetype');
             font-weight: 400;
             font-style: normal;
+            font-display: swap;
         }}
         @font-face {{
             font-family: 'ITVReem';
-            src: url('/static/ITV Reem-Medium.ttf') format('truetype');
+            src: url('/static/ITV Reem-Medium.woff2') format('woff2'),
+                 url('/static/ITV Reem-Medium.ttf') format('truetype');
             font-weight: 500;
             font-style: normal;
+            font-display: swap;
         }}
         @font-face {{
             font-family: 'ITVReem';
-            src: url('/static/ITV Reem-Bold.ttf') format('truetype');
+            src: url('/static/ITV Reem-Bold.woff2') format('woff2'),
+                 url('/static/ITV Reem-Bold.ttf') format('truetype');
             font-weight: 700;
             font-style: normal;
+            font-display: swap;
         }}
 
         * {{
@@ -1407,6 +1831,11 @@ def _get_base_styles() -> str:
             font-size: 12px;
         }}
 
+        /* Search filters toggle this class instead of writing inline styles */
+        .hide {{
+            display: none !important;
+        }}
+
         /* Matrix/Grid */
         .mapping-grid {{
             overflow-x: auto;
@@ -1472,243 +1901,318 @@ def _get_base_styles() -> str:
         .mb-20 {{
             margin-bottom: 20px;
         }}
-    </style>
+
+        /* Disconnect overlay */
+        #disconnected-overlay {{
+            display: none;
+            position: fixed;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: rgba(0, 0, 0, 0.9);
+            z-index: 10000;
+            justify-content: center;
+            align-items: center;
+            flex-direction: column;
+        }}
+        #disconnected-overlay.show {{
+            display: flex;
+        }}
+        .disconnect-message {{
+            background: #1a1a1a;
+            border: 2px solid #f44336;
+            border-radius: 12px;
+            padding: 40px;
+            text-align: center;
+            max-width: 500px;
+        }}
+        .disconnect-icon {{
+            font-size: 64px;
+            margin-bottom: 20px;
+        }}
+        .disconnect-title {{
+            font-size: 24px;
+            font-weight: bold;
+            color: #f44336;
+            margin-bottom: 10px;
+        }}
+        .disconnect-text {{
+            font-size: 16px;
+            color: #aaa;
+            margin-bottom: 20px;
+        }}
+        .reconnecting {{
+            display: inline-block;
+            width: 8px;
+            height: 8px;
+            background: #4caf50;
+            border-radius: 50%;
+            margin-right: 8px;
+            animation: pulse 1.5s ease-in-out infinite;
+        }}
+        @keyframes pulse {{
+            0%, 100% {{ opacity: 1; }}
+            50% {{ opacity: 0.3; }}
+        }}
     """
 
 
-def _get_nav_html(active_page: str = "home") -> str:
-    """Return navigation HTML - fixed top-left style matching Elliott's."""
-    pages = [
-        ("home", "Home", "/"),
-        ("tcp", "TCP Commands", "/tcp-commands"),
-        ("automator", "Automator Controls", "/automator-macros"),
-        ("mapping", "Command Mapping", "/command-mapping"),
-        ("settings", "Settings", "/settings"),
-    ]
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE = re.compile(r"\s*([{};:,>])\s*")
 
-    nav_items = ""
-    for page_id, title, url in pages:
-        active_class = ' class="active"' if page_id == active_page else ""
-        nav_items += f'<a href="{url}"{active_class}>{title}</a>'
 
-    # Add connection status indicator
-    connection_status = '<span id="connection-status" class="connection-status connected" title="Connected to server"></span>'
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_SPACE.sub(" ", css)
+    css = _CSS_PUNCT_SPACE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
 
-    return f'<div class="nav">{nav_items}{connection_status}</div>'
 
+@functools.lru_cache(maxsize=4)
+def _build_base_styles(theme: str) -> str:
+    """Build base CSS matching Elliott's Singular Control exactly (cached per theme, minified)."""
+    return _minify_css(_BASE_STYLES_TEMPLATE.format_map(_THEMES["light" if theme == "light" else "dark"]))
 
-def _get_base_html(title: str, content: str, active_page: str = "home") -> str:
-    """Return complete HTML page."""
-    return f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>{title} - Elliott's Sony Automator Controls v{_runtime_version()}</title>
-        {_get_base_styles()}
-        <style>
-            #disconnected-overlay {{
-                display: none;
-                position: fixed;
-                top: 0;
-                left: 0;
-                width: 100%;
-                height: 100%;
-                background: rgba(0, 0, 0, 0.9);
-                z-index: 10000;
-                justify-content: center;
-                align-items: center;
-                flex-direction: column;
-            }}
-            #disconnected-overlay.show {{
-                display: flex;
-            }}
-            .disconnect-message {{
-                background: #1a1a1a;
-                border: 2px solid #f44336;
-                border-radius: 12px;
-                padding: 40px;
-                text-align: center;
-                max-width: 500px;
-            }}
-            .disconnect-icon {{
-                font-size: 64px;
-                margin-bottom: 20px;
-            }}
-            .disconnect-title {{
-                font-size: 24px;
-                font-weight: bold;
-                color: #f44336;
-                margin-bottom: 10px;
-            }}
-            .disconnect-text {{
-                font-size: 16px;
-                color: #aaa;
-                margin-bottom: 20px;
-            }}
-            .reconnecting {{
-                display: inline-block;
-                width: 8px;
-                height: 8px;
-                background: #4caf50;
-                border-radius: 50%;
-                margin-right: 8px;
-                animation: pulse 1.5s ease-in-out infinite;
-            }}
-            @keyframes pulse {{
-                0%, 100% {{ opacity: 1; }}
-                50% {{ opacity: 0.3; }}
-            }}
-        </style>
-    </head>
-    <body>
-        {_get_nav_html(active_page)}
-        <h1>Elliott's Sony Automator Controls</h1>
-        <p style="color: #888; font-size: 0.9em; margin-top: -10px;">Version {_runtime_version()}</p>
-        <p>{title}</p>
-        {content}
 
-        <!-- Disconnect Overlay -->
-        <div id="disconnected-overlay">
-            <div class="disconnect-message">
-                <div class="disconnect-icon">⚠️</div>
-                <div class="disconnect-title">Server Disconnected</div>
-                <div class="disconnect-text">
-                    Lost connection to Elliott's Sony Automator Controls server.
-                </div>
-                <div style="color: #888;">
-                    <span class="reconnecting"></span>
-                    <span id="reconnect-status">Attempting to reconnect...</span>
-                </div>
-            </div>
-        </div>
+def _script_json(value: Any) -> str:
+    """Serialize value as JSON that is safe to embed in an inline <script> block."""
+    return orjson.dumps(value).decode().replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
 
-        <script>
-            // Disconnect detection
-            let heartbeatInterval = null;
-            let reconnectAttempts = 0;
-            const MAX_RECONNECT_ATTEMPTS = 999999; // Basically infinite
-            const HEARTBEAT_INTERVAL = 5000; // Check every 5 seconds
-            const RECONNECT_DELAY = 2000; // Wait 2 seconds between reconnect attempts
-
-            function startHeartbeat() {{
-                if (heartbeatInterval) {{
-                    clearInterval(heartbeatInterval);
-                }}
 
-                heartbeatInterval = setInterval(checkConnection, HEARTBEAT_INTERVAL);
-            }}
+def _script_json_parse(value: Any) -> str:
+    """Like _script_json, but as a JSON.parse() of a string literal.
 
-            async function checkConnection() {{
-                try {{
-                    const response = await fetch('/health', {{
-                        method: 'GET',
-                        cache: 'no-cache',
-                        signal: AbortSignal.timeout(3000)
-                    }});
-
-                    if (response.ok) {{
-                        // Connected
-                        const statusIndicator = document.getElementById('connection-status');
-                        if (statusIndicator) {{
-                            statusIndicator.classList.remove('disconnected');
-                            statusIndicator.classList.add('connected');
-                            statusIndicator.title = 'Connected to server';
-                        }}
-
-                        if (document.getElementById('disconnected-overlay').classList.contains('show')) {{
-                            // Was disconnected, now reconnected
-                            onReconnect();
-                        }}
-                        reconnectAttempts = 0;
-                    }} else {{
-                        onDisconnect();
-                    }}
-                }} catch (e) {{
-                    onDisconnect();
-                }}
-            }}
+    Engines parse a JSON string much faster than the equivalent object literal,
+    which matters for the large item lists embedded in the mapping page.
+    """
+    return f"JSON.parse({_script_json(orjson.dumps(value).decode())})"
 
-            function onDisconnect() {{
-                console.log('Server disconnected - showing overlay');
 
-                const statusIndicator = document.getElementById('connection-status');
-                if (statusIndicator) {{
-                    statusIndicator.classList.remove('connected');
-                    statusIndicator.classList.add('disconnected');
-                    statusIndicator.title = 'Disconnected from server';
-                }}
+def _js_attr(value: Any) -> str:
+    """Format value as a JS literal for use inside an HTML event-handler attribute."""
+    return escape(orjson.dumps(value).decode())
 
-                const overlay = document.getElementById('disconnected-overlay');
-                if (overlay) {{
-                    if (!overlay.classList.contains('show')) {{
-                        overlay.classList.add('show');
-                        console.log('Overlay shown');
-                    }}
-                }} else {{
-                    console.error('Disconnect overlay element not found!');
-                }}
 
-                reconnectAttempts++;
-                const status = document.getElementById('reconnect-status');
-                if (status) {{
-                    if (reconnectAttempts > 1) {{
-                        status.textContent = `Reconnecting... (attempt ${{reconnectAttempts}})`;
-                    }} else {{
-                        status.textContent = 'Attempting to reconnect...';
-                    }}
-                }}
-            }}
+_NAV_PAGES = (
+    ("home", "Home", "/"),
+    ("tcp", "TCP Commands", "/tcp-commands"),
+    ("automator", "Automator Controls", "/automator-macros"),
+    ("mapping", "Command Mapping", "/command-mapping"),
+    ("settings", "Settings", "/settings"),
+)
 
-            function onReconnect() {{
-                location.reload();
-            }}
 
-            // Start heartbeat when page loads (with slight delay to let page fully load)
-            console.log('Initializing disconnect detection system...');
-            setTimeout(() => {{
-                console.log('Starting heartbeat monitoring (checking every 5 seconds)');
-                startHeartbeat();
-            }}, 100);
-
-            // Also check connection when page becomes visible again
-            document.addEventListener('visibilitychange', () => {{
-                if (!document.hidden) {{
-                    checkConnection();
-                }}
-            }});
+def _build_nav_html(active_page: str) -> str:
+    """Build navigation HTML - fixed top-left style matching Elliott's."""
+    active_class = ' class="active"'
+    nav_items = "".join(
+        f'<a href="{url}"{active_class if page_id == active_page else ""}>{title}</a>'
+        for page_id, title, url in _NAV_PAGES
+    )
 
-            // Prevent page unload/navigation if server is disconnected
-            window.addEventListener('beforeunload', (e) => {{
-                const overlay = document.getElementById('disconnected-overlay');
-                if (overlay && overlay.classList.contains('show')) {{
-                    e.preventDefault();
-                    e.returnValue = '';
-                    return '';
-                }}
-            }});
-        </script>
+    # Add connection status indicator
+    connection_status = '<span id="connection-status" class="connection-status connected" title="Connected to server"></span>'
+
+    return f'<div class="nav">{nav_items}{connection_status}</div>'
+
+
+# The nav only varies by which page is active, so build each variant once
+_NAV_HTML = {page_id: _build_nav_html(page_id) for page_id, _, _ in _NAV_PAGES}
+
+
+def _get_nav_html(active_page: str = "home") -> str:
+    """Return navigation HTML with active_page highlighted."""
+    return _NAV_HTML.get(active_page) or _build_nav_html(active_page)
+
+
+# Script shared by every page (search debounce, disconnect detection); served from a versioned URL
+_APP_SCRIPT = """\
+// Run fn once input has been quiet for ms (used by the search boxes)
+function debounce(fn, ms) {
+    let timer = null;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), ms);
+    };
+}
+
+// Disconnect detection
+let heartbeatInterval = null;
+let reconnectAttempts = 0;
+const MAX_RECONNECT_ATTEMPTS = 999999; // Basically infinite
+const HEARTBEAT_INTERVAL = 5000; // Check every 5 seconds
+const RECONNECT_DELAY = 2000; // Wait 2 seconds between reconnect attempts
+
+function startHeartbeat() {
+    if (heartbeatInterval) {
+        clearInterval(heartbeatInterval);
+    }
+
+    heartbeatInterval = setInterval(checkConnection, HEARTBEAT_INTERVAL);
+}
+
+async function checkConnection() {
+    try {
+        const response = await fetch('/health', {
+            method: 'GET',
+            cache: 'no-cache',
+            signal: AbortSignal.timeout(3000)
+        });
+
+        if (response.ok) {
+            // Connected
+            const statusIndicator = document.getElementById('connection-status');
+            if (statusIndicator) {
+                statusIndicator.classList.remove('disconnected');
+                statusIndicator.classList.add('connected');
+                statusIndicator.title = 'Connected to server';
+            }
+
+            if (document.getElementById('disconnected-overlay').classList.contains('show')) {
+                // Was disconnected, now reconnected
+                onReconnect();
+            }
+            reconnectAttempts = 0;
+        } else {
+            onDisconnect();
+        }
+    } catch (e) {
+        onDisconnect();
+    }
+}
+
+function onDisconnect() {
+    console.log('Server disconnected - showing overlay');
+
+    const statusIndicator = document.getElementById('connection-status');
+    if (statusIndicator) {
+        statusIndicator.classList.remove('connected');
+        statusIndicator.classList.add('disconnected');
+        statusIndicator.title = 'Disconnected from server';
+    }
+
+    const overlay = document.getElementById('disconnected-overlay');
+    if (overlay) {
+        if (!overlay.classList.contains('show')) {
+            overlay.classList.add('show');
+            console.log('Overlay shown');
+        }
+    } else {
+        console.error('Disconnect overlay element not found!');
+    }
+
+    reconnectAttempts++;
+    const status = document.getElementById('reconnect-status');
+    if (status) {
+        if (reconnectAttempts > 1) {
+            status.textContent = `Reconnecting... (attempt ${reconnectAttempts})`;
+        } else {
+            status.textContent = 'Attempting to reconnect...';
+        }
+    }
+}
+
+function onReconnect() {
+    location.reload();
+}
+
+// Start heartbeat when page loads (with slight delay to let page fully load)
+console.log('Initializing disconnect detection system...');
+setTimeout(() => {
+    console.log('Starting heartbeat monitoring (checking every 5 seconds)');
+    startHeartbeat();
+}, 100);
+
+// Also check connection when page becomes visible again
+document.addEventListener('visibilitychange', () => {
+    if (!document.hidden) {
+        checkConnection();
+    }
+});
+
+// Prevent page unload/navigation if server is disconnected
+window.addEventListener('beforeunload', (e) => {
+    const overlay = document.getElementById('disconnected-overlay');
+    if (overlay && overlay.classList.contains('show')) {
+        e.preventDefault();
+        e.returnValue = '';
+        return '';
+    }
+});
+"""
+
+
+# Page shell shared by every HTML page, filled in by _get_base_html()
+_PAGE_TEMPLATE = """
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>{title} - Elliott's Sony Automator Controls v{version}</title>
+        {styles}
+        {scripts}
+    </head>
+    <body>
+        {nav}
+        <h1>Elliott's Sony Automator Controls</h1>
+        <p style="color: #888; font-size: 0.9em; margin-top: -10px;">Version {version}</p>
+        <p>{title}</p>
+        {content}
+
+        <!-- Disconnect Overlay -->
+        <div id="disconnected-overlay">
+            <div class="disconnect-message">
+                <div class="disconnect-icon">⚠️</div>
+                <div class="disconnect-title">Server Disconnected</div>
+                <div class="disconnect-text">
+                    Lost connection to Elliott's Sony Automator Controls server.
+                </div>
+                <div style="color: #888;">
+                    <span class="reconnecting"></span>
+                    <span id="reconnect-status">Attempting to reconnect...</span>
+                </div>
+            </div>
+        </div>
     </body>
     </html>
     """
 
 
-# API Routes
-@app.get("/", response_class=HTMLResponse)
-async def home():
-    """Home page with connection status."""
-    global config_data, tcp_servers, automator_status, server_start_time
+@functools.lru_cache(maxsize=16)
+def _page_chrome(title: str, active_page: str, theme: str) -> Tuple[str, str]:
+    """Return the page shell before and after the content slot (cached per page and theme)."""
+    fields = {
+        "title": title,
+        "version": _runtime_version(),
+        "styles": _get_base_styles(),
+        "scripts": _get_base_scripts(),
+        "nav": _get_nav_html(active_page),
+    }
+    prefix, suffix = _PAGE_TEMPLATE.split("{content}")
+    return prefix.format_map(fields), suffix.format_map(fields)
 
-    # Check for first-run or no Automators configured
-    is_first_run = config_data.get("first_run", False)
-    automators = get_all_automators()
-    show_welcome = is_first_run or len(automators) == 0
 
-    # Welcome banner
-    welcome_html = ""
-    if show_welcome:
-        welcome_html = """
+def _get_base_html(title: str, content: str, active_page: str = "home") -> str:
+    """Return complete HTML page."""
+    prefix, suffix = _page_chrome(title, active_page, config_data.get("theme", "dark"))
+    return prefix + content + suffix
+
+
+def _etag_response(request: Request, body: str) -> Response:
+    """Return an HTML page tagged with a content hash, or 304 if the client already has it."""
+    etag = f'"{hashlib.blake2b(body.encode(), digest_size=8).hexdigest()}"'
+    client_tags = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().lstrip("W/") for tag in client_tags.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return HTMLResponse(body, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+# Static welcome banner shown on first run
+_WELCOME_HTML = """
         <div class="section" style="background: linear-gradient(135deg, #00bcd4 0%, #0097a7 100%); color: white; border-radius: 12px; padding: 30px; margin-bottom: 30px; box-shadow: 0 4px 20px rgba(0, 188, 212, 0.3);">
             <h2 style="color: white; margin-top: 0;">👋 Welcome to Sony Automator Controls v1.1.1!</h2>
             <p style="font-size: 16px; margin-bottom: 20px;">Let's get you set up in a few easy steps:</p>
@@ -1721,28 +2225,69 @@ async def home():
         </div>
         """
 
+
+# API Routes
+@app.get("/styles/{version}/{theme}.css")
+async def base_stylesheet(version: str, theme: str):
+    """Serve the base stylesheet; the versioned URL makes it safe to cache for good."""
+    return Response(
+        _build_base_styles("light" if theme == "light" else "dark"),
+        media_type="text/css",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
+
+
+@app.get("/scripts/{version}/app.js")
+async def app_script(version: str):
+    """Serve the shared page script; the versioned URL makes it safe to cache for good."""
+    return Response(
+        _APP_SCRIPT,
+        media_type="text/javascript",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
+
+
+@app.get("/", response_class=HTMLResponse)
+async def home(request: Request):
+    """Home page with connection status."""
+    global config_data, tcp_servers, automator_status, server_start_time
+
+    tcp_listeners = config_data.get("tcp_listeners", [])
+    tcp_commands = config_data.get("tcp_commands", [])
+    mappings = config_data.get("command_mappings", [])
+    enabled_listeners = sum(1 for l in tcp_listeners if l["enabled"])
+
+    # Check for first-run or no Automators configured
+    is_first_run = config_data.get("first_run", False)
+    automators = get_all_automators()
+    show_welcome = is_first_run or len(automators) == 0
+
+    # Welcome banner
+    welcome_html = _WELCOME_HTML if show_welcome else ""
+
     # Build TCP listener status
-    tcp_status_html = ""
-    for listener in config_data.get("tcp_listeners", []):
+    tcp_status_cards = []
+    for listener in tcp_listeners:
         port = listener["port"]
-        name = listener["name"]
+        port_h = escape(str(port))
+        name = escape(listener["name"])
         enabled = listener["enabled"]
 
         if enabled and port in tcp_servers:
             status_class = "connected"
-            status_text = f"Listening on port {port}"
-            conn_count = len(tcp_connections.get(port, []))
+            status_text = f"Listening on port {port_h}"
+            conn_count = len(tcp_connections.get(port, {}))
             detail = f"{conn_count} active connection(s)"
         elif enabled:
             status_class = "disconnected"
             status_text = "Failed to start"
-            detail = f"Port {port} unavailable"
+            detail = f"Port {port_h} unavailable"
         else:
             status_class = "idle"
             status_text = "Disabled"
-            detail = f"Port {port}"
+            detail = f"Port {port_h}"
 
-        tcp_status_html += f"""
+        tcp_status_cards.append(f"""
         <div class="status-card">
             <h3>{name}</h3>
             <div class="status-indicator">
@@ -1751,10 +2296,11 @@ async def home():
             </div>
             <div class="status-detail">{detail}</div>
         </div>
-        """
+        """)
+
+    tcp_status_html = "".join(tcp_status_cards)
 
     # Build Automator status cards (one per Automator)
-    automator_status_html = ""
     if len(automators) == 0:
         automator_status_html = """
         <div class="status-card">
@@ -1767,27 +2313,31 @@ async def home():
         </div>
         """
     else:
+        statuses = await _automator_statuses(automators)
+        automator_status_cards = []
         for automator in automators:
-            status = check_automator_connection(automator["id"])
+            status = statuses[automator["id"]]
             if status["connected"]:
                 auto_class = "connected"
                 auto_text = "Connected"
-                auto_detail = automator.get("url", "")
+                auto_detail = escape(automator.get("url", ""))
             else:
                 auto_class = "disconnected"
                 auto_text = "Disconnected"
-                auto_detail = status.get("error", "Not configured")
+                auto_detail = escape(status.get("error") or "Not configured")
 
-            automator_status_html += f"""
+            automator_status_cards.append(f"""
             <div class="status-card">
-                <h3>{automator['name']}</h3>
+                <h3>{escape(automator['name'])}</h3>
                 <div class="status-indicator">
                     <div class="status-dot {auto_class}"></div>
                     <span class="status-text">{auto_text}</span>
                 </div>
                 <div class="status-detail">{auto_detail}</div>
             </div>
-            """
+            """)
+
+        automator_status_html = "".join(automator_status_cards)
 
     # Server uptime
     uptime_seconds = int(time.time() - server_start_time)
@@ -1796,7 +2346,7 @@ async def home():
     uptime_text = f"{hours}h {minutes}m"
 
     # Event log
-    event_log_html = "\\n".join(f"<div>{event}</div>" for event in COMMAND_LOG[-20:])
+    event_log_html = recent_events_html()
     if not event_log_html:
         event_log_html = "<div style='color: #888;'>No events yet...</div>"
 
@@ -1835,19 +2385,19 @@ async def home():
             <div class="status-card">
                 <h3>TCP Commands</h3>
                 <div style="font-size: 32px; font-weight: 700; color: #00bcd4;">
-                    {len(config_data.get('tcp_commands', []))}
+                    {len(tcp_commands)}
                 </div>
             </div>
             <div class="status-card">
                 <h3>Active Mappings</h3>
                 <div style="font-size: 32px; font-weight: 700; color: #00bcd4;">
-                    {len(config_data.get('command_mappings', []))}
+                    {len(mappings)}
                 </div>
             </div>
             <div class="status-card">
                 <h3>TCP Listeners</h3>
                 <div style="font-size: 32px; font-weight: 700; color: #00bcd4;">
-                    {len([l for l in config_data.get('tcp_listeners', []) if l['enabled']])}
+                    {enabled_listeners}
                 </div>
             </div>
         </div>
@@ -1855,7 +2405,7 @@ async def home():
 
     <div class="section">
         <h2>Event Log</h2>
-        <p style="color: #888888; margin-bottom: 12px;">Recent commands and system events (last 20 entries)</p>
+        <p style="color: #888888; margin-bottom: 12px;">Recent commands and system events (last {DASHBOARD_LOG_ENTRIES} entries)</p>
         <div id="event-log" style="background: #000; color: #00bcd4; padding: 16px; border-radius: 8px; font-family: 'SF Mono', Monaco, 'Cascadia Code', Consolas, monospace; font-size: 13px; max-height: 300px; overflow-y: auto; line-height: 1.8;">
             {event_log_html}
         </div>
@@ -1873,55 +2423,88 @@ async def home():
     </script>
     """
 
-    return _get_base_html("Home", content, "home")
-
-
-@app.get("/tcp-commands", response_class=HTMLResponse)
-async def tcp_commands_page():
-    """TCP Commands management page."""
-    global config_data
+    return _etag_response(request, _get_base_html("Home", content, "home"))
 
-    commands = config_data.get("tcp_commands", [])
-    listeners = config_data.get("tcp_listeners", [])
 
-    # Build commands list
-    commands_html = ""
-    for cmd in commands:
-        commands_html += f"""
-        <div class="item searchable-tcp-command" data-name="{cmd['name'].lower()}" data-trigger="{cmd['tcp_trigger'].lower()}" data-description="{cmd.get('description', '').lower()}">
+# Per-row markup, filled with str.format_map from already-escaped values
+_TCP_COMMAND_TEMPLATE = """
+        <div class="item searchable-tcp-command" data-name="{name_lower}" data-trigger="{trigger_lower}" data-description="{description_lower}">
             <div class="item-info">
-                <div class="item-title">{cmd['name']}</div>
-                <div class="item-detail">TCP Trigger: <strong>{cmd['tcp_trigger']}</strong></div>
-                <div class="item-detail">{cmd.get('description', '')}</div>
+                <div class="item-title">{name}</div>
+                <div class="item-detail">TCP Trigger: <strong>{trigger}</strong></div>
+                <div class="item-detail">{description}</div>
             </div>
             <div class="item-actions">
-                <button class="secondary" onclick="editCommand('{cmd['id']}')">Edit</button>
-                <button class="danger" onclick="deleteCommand('{cmd['id']}')">Delete</button>
+                <button class="secondary" onclick="editCommand({id_js})">Edit</button>
+                <button class="danger" onclick="deleteCommand({id_js})">Delete</button>
             </div>
         </div>
         """
 
+
+def _render_tcp_commands_html(commands: List[dict]) -> str:
+    """Render the TCP command list (used by the page and by config updates)."""
+    command_items = []
+    for cmd in commands:
+        # Escaped entities are already lowercase, so the search attributes can lower the escaped text
+        name = escape(cmd["name"])
+        trigger = escape(cmd["tcp_trigger"])
+        description = escape(cmd.get("description", ""))
+        command_items.append(_TCP_COMMAND_TEMPLATE.format_map({
+            "name": name,
+            "name_lower": name.lower(),
+            "trigger": trigger,
+            "trigger_lower": trigger.lower(),
+            "description": description,
+            "description_lower": description.lower(),
+            "id_js": _js_attr(cmd["id"]),
+        }))
+    commands_html = "".join(command_items)
+
     if not commands_html:
         commands_html = '<div class="alert info">No TCP commands configured yet. Add your first command below.</div>'
 
-    # Build listeners list
-    listeners_html = ""
+    return commands_html
+
+
+def _render_tcp_listeners_html(listeners: List[dict]) -> str:
+    """Render the TCP listener list (used by the page and by config updates)."""
+    listener_items = []
     for listener in listeners:
         enabled_badge = "🟢 Enabled" if listener["enabled"] else "🔴 Disabled"
-        listeners_html += f"""
+        port_js = _js_attr(listener["port"])
+        listener_items.append(f"""
         <div class="item">
             <div class="item-info">
-                <div class="item-title">{listener['name']} - Port {listener['port']}</div>
+                <div class="item-title">{escape(listener['name'])} - Port {escape(str(listener['port']))}</div>
                 <div class="item-detail">{enabled_badge}</div>
             </div>
             <div class="item-actions">
-                <button class="secondary" onclick="toggleListener({listener['port']})">
+                <button class="secondary" onclick="toggleListener({port_js})">
                     {'Disable' if listener['enabled'] else 'Enable'}
                 </button>
-                <button class="danger" onclick="deleteListener({listener['port']})">Delete</button>
+                <button class="danger" onclick="deleteListener({port_js})">Delete</button>
             </div>
         </div>
-        """
+        """)
+
+    return "".join(listener_items)
+
+
+@app.get("/tcp-commands", response_class=HTMLResponse)
+async def tcp_commands_page():
+    """TCP Commands management page."""
+    global config_data
+
+    commands = config_data.get("tcp_commands", [])
+    listeners = config_data.get("tcp_listeners", [])
+
+    # Serialize once; the page script exposes them as LISTENERS / COMMANDS
+    commands_json = _script_json(commands)
+    listeners_json = _script_json(listeners)
+
+    commands_html = _render_tcp_commands_html(commands)
+    listeners_html = _render_tcp_listeners_html(listeners)
 
     content = f"""
     <h1>TCP Commands</h1>
@@ -1929,7 +2512,7 @@ async def tcp_commands_page():
     <div class="section">
         <h2>TCP Listeners</h2>
         <p style="color: #888888; margin-bottom: 20px;">Configure which ports to listen for incoming TCP commands.</p>
-        <div class="item-list">
+        <div class="item-list" id="tcp-listeners-list">
             {listeners_html}
         </div>
 
@@ -1958,7 +2541,7 @@ async def tcp_commands_page():
         <p style="color: #888888; margin-bottom: 20px;">Define TCP commands that will be recognized by the system.</p>
 
         <div style="margin-bottom: 20px;">
-            <input type="text" id="tcpCommandSearchBox" placeholder="Search commands by name, trigger, or description..." style="width: 100%; padding: 10px 14px; font-size: 14px; border-radius: 8px;" oninput="filterTCPCommands()">
+            <input type="text" id="tcpCommandSearchBox" placeholder="Search commands by name, trigger, or description..." style="width: 100%; padding: 10px 14px; font-size: 14px; border-radius: 8px;" oninput="filterTCPCommandsDebounced()">
         </div>
 
         <div class="item-list" id="tcp-commands-list">
@@ -1995,6 +2578,23 @@ async def tcp_commands_page():
     </div>
 
     <script>
+        // Current config, embedded once; handlers build new arrays from these
+        let LISTENERS = {listeners_json};
+        let COMMANDS = {commands_json};
+
+        // Swap in the saved lists and markup returned by /api/config instead of reloading the page
+        function showListeners(listeners, html) {{
+            LISTENERS = listeners;
+            document.getElementById('tcp-listeners-list').innerHTML = html;
+        }}
+
+        function showCommands(commands, html) {{
+            COMMANDS = commands;
+            document.getElementById('tcp-commands-list').innerHTML = html;
+            tcpSearchIndex = buildTcpSearchIndex();
+            filterTCPCommands();
+        }}
+
         function showAddListenerForm() {{
             document.getElementById('listener-form').style.display = 'block';
             document.getElementById('add-listener-btn').style.display = 'none';
@@ -2023,8 +2623,7 @@ async def tcp_commands_page():
         }}
 
         async function addListener(port, name) {{
-            const listeners = {json.dumps(listeners)};
-            listeners.push({{port: port, name: name, enabled: true}});
+            const listeners = [...LISTENERS, {{port: port, name: name, enabled: true}}];
 
             const response = await fetch('/api/config', {{
                 method: 'POST',
@@ -2033,7 +2632,9 @@ async def tcp_commands_page():
             }});
 
             if (response.ok) {{
-                location.reload();
+                const data = await response.json();
+                showListeners(data.tcp_listeners, data.listeners_html);
+                cancelListenerForm();
             }} else {{
                 const statusDiv = document.getElementById('listener-status');
                 statusDiv.innerHTML = '<div class="alert error">Error adding listener</div>';
@@ -2042,7 +2643,7 @@ async def tcp_commands_page():
         }}
 
         async function deleteListener(port) {{
-            const listeners = {json.dumps(listeners)}.filter(l => l.port !== port);
+            const listeners = LISTENERS.filter(l => l.port !== port);
 
             const response = await fetch('/api/config', {{
                 method: 'POST',
@@ -2051,7 +2652,8 @@ async def tcp_commands_page():
             }});
 
             if (response.ok) {{
-                location.reload();
+                const data = await response.json();
+                showListeners(data.tcp_listeners, data.listeners_html);
             }} else {{
                 const statusDiv = document.getElementById('listener-status');
                 statusDiv.innerHTML = '<div class="alert error">Error deleting listener</div>';
@@ -2060,12 +2662,7 @@ async def tcp_commands_page():
         }}
 
         async function toggleListener(port) {{
-            const listeners = {json.dumps(listeners)}.map(l => {{
-                if (l.port === port) {{
-                    l.enabled = !l.enabled;
-                }}
-                return l;
-            }});
+            const listeners = LISTENERS.map(l => l.port === port ? {{...l, enabled: !l.enabled}} : l);
 
             const response = await fetch('/api/config', {{
                 method: 'POST',
@@ -2074,7 +2671,8 @@ async def tcp_commands_page():
             }});
 
             if (response.ok) {{
-                location.reload();
+                const data = await response.json();
+                showListeners(data.tcp_listeners, data.listeners_html);
             }} else {{
                 const statusDiv = document.getElementById('listener-status');
                 statusDiv.innerHTML = '<div class="alert error">Error toggling listener</div>';
@@ -2119,9 +2717,8 @@ async def tcp_commands_page():
         }}
 
         async function addCommand(name, trigger, description) {{
-            const commands = {json.dumps(commands)};
             const id = 'cmd_' + Date.now();
-            commands.push({{id: id, name: name, tcp_trigger: trigger, description: description}});
+            const commands = [...COMMANDS, {{id: id, name: name, tcp_trigger: trigger, description: description}}];
 
             const response = await fetch('/api/config', {{
                 method: 'POST',
@@ -2130,7 +2727,9 @@ async def tcp_commands_page():
             }});
 
             if (response.ok) {{
-                location.reload();
+                const data = await response.json();
+                showCommands(data.tcp_commands, data.commands_html);
+                cancelCommandForm();
             }} else {{
                 const statusDiv = document.getElementById('command-status');
                 statusDiv.innerHTML = '<div class="alert error">Error adding command</div>';
@@ -2139,7 +2738,7 @@ async def tcp_commands_page():
         }}
 
         async function deleteCommand(id) {{
-            const commands = {json.dumps(commands)}.filter(c => c.id !== id);
+            const commands = COMMANDS.filter(c => c.id !== id);
 
             const response = await fetch('/api/config', {{
                 method: 'POST',
@@ -2148,7 +2747,8 @@ async def tcp_commands_page():
             }});
 
             if (response.ok) {{
-                location.reload();
+                const data = await response.json();
+                showCommands(data.tcp_commands, data.commands_html);
             }} else {{
                 const statusDiv = document.getElementById('command-status');
                 statusDiv.innerHTML = '<div class="alert error">Error deleting command</div>';
@@ -2157,8 +2757,7 @@ async def tcp_commands_page():
         }}
 
         function editCommand(id) {{
-            const commands = {json.dumps(commands)};
-            const cmd = commands.find(c => c.id === id);
+            const cmd = COMMANDS.find(c => c.id === id);
             if (!cmd) {{
                 const statusDiv = document.getElementById('command-status');
                 statusDiv.innerHTML = '<div class="alert error">Command not found</div>';
@@ -2177,22 +2776,17 @@ async def tcp_commands_page():
         }}
 
         async function updateCommand(id, name, trigger, description) {{
-            const commands = {json.dumps(commands)};
-            const updatedCommands = commands.map(c => {{
-                if (c.id === id) {{
-                    return {{id: id, name: name, tcp_trigger: trigger, description: description}};
-                }}
-                return c;
-            }});
-
+            // Send only the edited command; the server merges it by ID
             const response = await fetch('/api/config', {{
                 method: 'POST',
                 headers: {{'Content-Type': 'application/json'}},
-                body: JSON.stringify({{tcp_commands: updatedCommands}})
+                body: JSON.stringify({{update_tcp_command: {{id: id, name: name, tcp_trigger: trigger, description: description}}}})
             }});
 
             if (response.ok) {{
-                location.reload();
+                const data = await response.json();
+                showCommands(data.tcp_commands, data.commands_html);
+                cancelCommandForm();
             }} else {{
                 const statusDiv = document.getElementById('command-status');
                 statusDiv.innerHTML = '<div class="alert error">Error updating command</div>';
@@ -2201,7 +2795,8 @@ async def tcp_commands_page():
         }}
 
         // TCP Capture functions
-        let captureCheckInterval = null;
+        const CAPTURE_TIMEOUT = 30000; // Auto-cancel after 30 seconds
+        let captureActive = false;
 
         async function startTCPCapture() {{
             const statusDiv = document.getElementById('capture-status');
@@ -2214,15 +2809,8 @@ async def tcp_commands_page():
                 }});
 
                 if (response.ok) {{
-                    // Start polling for capture result
-                    captureCheckInterval = setInterval(checkCaptureStatus, 500);
-
-                    // Auto-cancel after 30 seconds
-                    setTimeout(() => {{
-                        if (captureCheckInterval) {{
-                            cancelCapture();
-                        }}
-                    }}, 30000);
+                    captureActive = true;
+                    waitForCapture(Date.now() + CAPTURE_TIMEOUT);
                 }} else {{
                     statusDiv.innerHTML = '<div class="alert error">Failed to start capture mode</div>';
                 }}
@@ -2231,27 +2819,60 @@ async def tcp_commands_page():
             }}
         }}
 
-        async function checkCaptureStatus() {{
+        // Long-poll: the server holds each request until a command arrives, capture is cancelled, or the wait runs out
+        async function waitForCapture(deadline) {{
+            let retryDelay = 500;
+            while (captureActive && Date.now() < deadline) {{
+                const wait = Math.ceil((deadline - Date.now()) / 1000);
+                const done = await checkCaptureStatus(wait);
+                if (done) {{
+                    return;
+                }}
+                if (done === null) {{
+                    // Request failed: back off (500ms growing to 2s) rather than retrying in a tight loop
+                    await new Promise(resolve => setTimeout(resolve, retryDelay));
+                    retryDelay = Math.min(retryDelay * 1.5, 2000);
+                }} else {{
+                    retryDelay = 500;
+                }}
+            }}
+            if (captureActive) {{
+                cancelCapture();
+            }}
+        }}
+
+        // Returns true once the capture session is over (captured or cancelled), null if the request failed
+        async function checkCaptureStatus(wait) {{
             try {{
-                const response = await fetch('/tcp/capture/status');
+                const response = await fetch('/tcp/capture/status?wait=' + wait);
                 const data = await response.json();
 
+                if (data.status === 'idle') {{
+                    return true;
+                }}
+
                 if (data.status === 'captured') {{
-                    // Stop polling
-                    clearInterval(captureCheckInterval);
-                    captureCheckInterval = null;
+                    captureActive = false;
 
                     // Show captured command
                     const cmd = data.data.command;
                     const port = data.data.port;
                     const source = data.data.source;
 
+                    // Captured values come straight off the wire, so set them as text rather than markup
                     const statusDiv = document.getElementById('capture-status');
-                    statusDiv.innerHTML = '<div class="alert success">Captured TCP command: <strong>' + cmd + '</strong> from port ' + port + ' (source: ' + source + ')<br><button class="primary mt-10" onclick="addCapturedCommand(\\''+cmd+'\\')">Add as TCP Command</button></div>';
+                    statusDiv.innerHTML = '<div class="alert success">Captured TCP command: <strong id="captured-command"></strong> from port <span id="captured-port"></span> (source: <span id="captured-source"></span>)<br><button class="primary mt-10" id="add-captured-btn">Add as TCP Command</button></div>';
+                    document.getElementById('captured-command').textContent = cmd;
+                    document.getElementById('captured-port').textContent = port;
+                    document.getElementById('captured-source').textContent = source;
+                    document.getElementById('add-captured-btn').onclick = () => addCapturedCommand(cmd);
+                    return true;
                 }}
             }} catch (e) {{
                 console.error('Error checking capture status:', e);
+                return null;
             }}
+            return false;
         }}
 
         function addCapturedCommand(cmd) {{
@@ -2267,10 +2888,7 @@ async def tcp_commands_page():
         }}
 
         async function cancelCapture() {{
-            if (captureCheckInterval) {{
-                clearInterval(captureCheckInterval);
-                captureCheckInterval = null;
-            }}
+            captureActive = false;
 
             await fetch('/tcp/capture/cancel', {{
                 method: 'POST',
@@ -2282,23 +2900,21 @@ async def tcp_commands_page():
             setTimeout(() => statusDiv.innerHTML = '', 3000);
         }}
 
+        // One lowercase search string per command, rebuilt only when the list is re-rendered
+        function buildTcpSearchIndex() {{
+            return Array.from(document.getElementsByClassName('searchable-tcp-command'), el => ({{
+                el,
+                hay: el.dataset.name + '|' + el.dataset.trigger + '|' + el.dataset.description
+            }}));
+        }}
+        let tcpSearchIndex = buildTcpSearchIndex();
+
         function filterTCPCommands() {{
             const searchTerm = document.getElementById('tcpCommandSearchBox').value.toLowerCase();
-            const items = document.querySelectorAll('.searchable-tcp-command');
-
-            items.forEach(item => {{
-                const name = item.getAttribute('data-name');
-                const trigger = item.getAttribute('data-trigger');
-                const description = item.getAttribute('data-description');
-                const matches = name.includes(searchTerm) || trigger.includes(searchTerm) || description.includes(searchTerm);
 
-                if (matches) {{
-                    item.style.display = 'flex';
-                }} else {{
-                    item.style.display = 'none';
-                }}
-            }});
+            tcpSearchIndex.forEach(({{el, hay}}) => el.classList.toggle('hide', !hay.includes(searchTerm)));
         }}
+        const filterTCPCommandsDebounced = debounce(filterTCPCommands, 120);
     </script>
     """
 
@@ -2306,15 +2922,64 @@ async def tcp_commands_page():
 
 
 @app.get("/automator-macros", response_class=HTMLResponse)
-async def automator_macros_page():
-    """Automator Controls page."""
-    global config_data, automator_data_cache
-
-    # Get all Automators
+async def automator_macros_page(request: Request):
+    """Automator Controls page (re-rendered only when its data or a connection status changes)."""
     automators = get_all_automators()
+    statuses = await _automator_statuses(automators)
+
+    key = _page_key("automator-macros", tuple(status["connected"] for status in statuses.values()))
+    page = _page_cache.get(key)
+    if page is None:
+        page = _page_cache[key] = await _render_automator_macros_page(automators, statuses)
+    return _etag_response(request, page)
+
+
+# Buttons carry a data-action; the page handles clicks with one delegated listener per container
+_AUTOMATOR_CARD_TEMPLATE = """
+        <div class="item" data-automator-id="{id}" data-automator-name="{name}">
+            <div class="item-info">
+                <div class="item-title">{name} - {url}</div>
+                <div class="item-detail">{enabled_badge} | {status_badge} | {total_items} items cached</div>
+            </div>
+            <div class="item-actions">
+                <button class="secondary" data-action="toggle">
+                    {toggle_label}
+                </button>
+                <button class="secondary" data-action="edit">Edit</button>
+                <button class="danger" data-action="delete">Delete</button>
+            </div>
+        </div>
+        """
+
+_AUTOMATOR_ITEM_TEMPLATE = """
+                <div class="item searchable-item" data-name="{name_lower}" data-automator="{automator_id}" data-type="{type}" data-id="{id}">
+                    <div class="item-info">
+                        <div class="item-title">{name}</div>
+                    </div>
+                    <div class="item-actions">
+                        <a href="javascript:void(0)" class="play-btn" data-action="test" title="Test {name}">▶</a>
+                    </div>
+                </div>
+                """
+
+
+@functools.lru_cache(maxsize=256)
+def _format_last_updated(iso: str) -> str:
+    """Format a cache's ISO last_updated stamp for display ("" if it can't be parsed)."""
+    try:
+        return datetime.fromisoformat(iso).strftime("%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        return ""
+
+
+def _render_automator_fragments(automators: List[dict], statuses: Dict[str, dict]) -> Tuple[str, str]:
+    """Render the Automator cards and item sections (used by the page and by Automator updates)."""
+    # Gather per-Automator data up front so the passes below only format strings
+    caches = {a["id"]: get_automator_cache(a["id"]) for a in automators}
+    cached_items = {auto_id: _get_cached_items(auto_id) for auto_id in caches}
 
     # Build Automator management section (at the TOP per user request)
-    automator_items_html = ""
+    automator_items = []
 
     for automator in automators:
         auto_id = automator["id"]
@@ -2322,72 +2987,35 @@ async def automator_macros_page():
         auto_url = automator.get("url", "Not configured")
         auto_enabled = automator.get("enabled", False)
 
-        # Check connection status
-        status = check_automator_connection(auto_id)
+        # Connection status
+        status = statuses[auto_id]
         if status["connected"]:
             status_badge = "🟢 Connected"
         else:
             status_badge = "🔴 Disconnected"
 
-        # Get cache info
-        cache = get_automator_cache(auto_id)
-        total_items = len(cache.get("macros", [])) + len(cache.get("buttons", [])) + len(cache.get("shortcuts", []))
+        total_items = len(cached_items[auto_id])
 
         enabled_badge = "🟢 Enabled" if auto_enabled else "🔴 Disabled"
 
-        automator_items_html += f"""
-        <div class="item">
-            <div class="item-info">
-                <div class="item-title">{auto_name} - {auto_url}</div>
-                <div class="item-detail">{enabled_badge} | {status_badge} | {total_items} items cached</div>
-            </div>
-            <div class="item-actions">
-                <button class="secondary" onclick="toggleAutomator('{auto_id}')">
-                    {'Disable' if auto_enabled else 'Enable'}
-                </button>
-                <button class="secondary" onclick="editAutomator('{auto_id}')">Edit</button>
-                <button class="danger" onclick="deleteAutomator('{auto_id}', '{auto_name}')">Delete</button>
-            </div>
-        </div>
-        """
-
-    automator_management = f"""
-    <div class="section">
-        <h2>Automator Connections</h2>
-        <p style="color: #888888; margin-bottom: 20px;">Configure connections to your Cuez Automator instances.</p>
-        <div class="item-list">
-            {automator_items_html}
-        </div>
-
-        <div id="automator-form" style="display: none; margin-top: 20px; padding: 20px; background: #1e1e1e; border-radius: 8px; border: 1px solid #333;">
-            <h3 style="margin-top: 0;" id="automator-form-title">Add Automator</h3>
-            <input type="hidden" id="automator-edit-id">
-            <div style="margin-bottom: 15px;">
-                <label style="display: block; margin-bottom: 5px; font-weight: 600;">Name</label>
-                <input type="text" id="automator-name" placeholder="e.g., Primary Automator" style="width: 100%; padding: 10px; font-size: 14px; border-radius: 6px;">
-            </div>
-            <div style="margin-bottom: 15px;">
-                <label style="display: block; margin-bottom: 5px; font-weight: 600;">API URL</label>
-                <input type="text" id="automator-url" placeholder="http://127.0.0.1:7070" style="width: 100%; padding: 10px; font-size: 14px; border-radius: 6px;">
-            </div>
-            <div style="display: flex; gap: 10px;">
-                <button class="primary" onclick="saveAutomator()">Save</button>
-                <button class="secondary" onclick="cancelAutomatorForm()">Cancel</button>
-            </div>
-        </div>
-
-        <button class="primary mt-20" onclick="showAddAutomatorForm()" id="add-automator-btn">Add Automator</button>
-        <div id="automator-status" style="margin-top: 16px;"></div>
-    </div>
-    """
+        automator_items.append(_AUTOMATOR_CARD_TEMPLATE.format_map({
+            "name": escape(auto_name),
+            "url": escape(auto_url),
+            "enabled_badge": enabled_badge,
+            "status_badge": status_badge,
+            "total_items": total_items,
+            "toggle_label": "Disable" if auto_enabled else "Enable",
+            "id": escape(auto_id),
+        }))
+    automator_items_html = "".join(automator_items)
 
     # Build sections for each Automator
     def build_automator_section(automator):
         auto_id = automator["id"]
         auto_name = automator["name"]
+        auto_id_h = escape(auto_id)
 
-        # Fetch all items for this Automator
-        all_items = fetch_automator_macros(auto_id)
+        all_items = cached_items[auto_id]
 
         # Organize by type
         macros_list = []
@@ -2408,24 +3036,22 @@ async def automator_macros_page():
             if not items:
                 return ""
 
-            items_html = ""
+            item_parts = []
             for item in items:
-                item_id = item.get("id", "")
                 item_name = item.get("title", item.get("name", "Unknown"))
                 item_type = item.get("type", "macro")
-                items_html += f"""
-                <div class="item searchable-item" data-name="{item_name.lower()}" data-automator="{auto_id}" data-type="{item_type}">
-                    <div class="item-info">
-                        <div class="item-title">{item_name}</div>
-                    </div>
-                    <div class="item-actions">
-                        <a href="javascript:void(0)" class="play-btn" onclick="testMacro('{item_id}', '{item_name}', '{item_type}', '{auto_id}')" title="Test {item_name}">▶</a>
-                    </div>
-                </div>
-                """
+                name_h = escape(item_name)
+                item_parts.append(_AUTOMATOR_ITEM_TEMPLATE.format_map({
+                    "name": name_h,
+                    "name_lower": name_h.lower(),
+                    "type": escape(item_type),
+                    "automator_id": auto_id_h,
+                    "id": escape(str(item.get("id", ""))),
+                }))
+            items_html = "".join(item_parts)
 
             return f"""
-            <details id="{section_id}-{auto_id}" style="margin-left: 20px;">
+            <details id="{section_id}-{auto_id_h}" style="margin-left: 20px;">
                 <summary style="cursor: pointer; font-weight: 500; font-size: 14px; margin-bottom: 10px; padding: 8px; background: #252525; border-radius: 6px;">
                     {section_title} ({len(items)})
                 </summary>
@@ -2436,14 +3062,11 @@ async def automator_macros_page():
             """
 
         # Get cache info
-        cache = get_automator_cache(auto_id)
+        last_updated = caches[auto_id].get("last_updated")
+        last_updated = _format_last_updated(last_updated) if last_updated else ""
         cache_info = ""
-        if cache.get("last_updated"):
-            try:
-                last_updated = datetime.fromisoformat(cache["last_updated"])
-                cache_info = f'<p style="color: #888; font-size: 12px; margin: 8px 0 8px 20px;">Last updated: {last_updated.strftime("%Y-%m-%d %H:%M:%S")}</p>'
-            except:
-                pass
+        if last_updated:
+            cache_info = f'<p style="color: #888; font-size: 12px; margin: 8px 0 8px 20px;">Last updated: {last_updated}</p>'
 
         if not all_items:
             subsections_html = '<p style="color: #888; margin-left: 20px;">No cached data. Click "Refresh All" below to load items.</p>'
@@ -2455,9 +3078,9 @@ async def automator_macros_page():
             """
 
         return f"""
-        <details id="automator-{auto_id}" style="margin-bottom: 15px;">
+        <details id="automator-{auto_id_h}" style="margin-bottom: 15px;">
             <summary style="cursor: pointer; font-weight: 600; font-size: 16px; margin-bottom: 12px; padding: 12px; background: #1e1e1e; border-radius: 6px; border: 1px solid #333;">
-                {auto_name} ({len(all_items)} items total)
+                {escape(auto_name)} ({len(all_items)} items total)
             </summary>
             {cache_info}
             {subsections_html}
@@ -2468,9 +3091,51 @@ async def automator_macros_page():
     if len(automators) == 0:
         all_sections_html = '<div class="alert info">No Automators configured. Add an Automator above to get started.</div>'
     else:
-        all_sections_html = ""
-        for automator in automators:
-            all_sections_html += build_automator_section(automator)
+        all_sections_html = "".join([build_automator_section(automator) for automator in automators])
+
+    return automator_items_html, all_sections_html
+
+
+async def _automator_fragments() -> Dict[str, str]:
+    """Re-render the Automator page's cards and item sections for API responses."""
+    automators = get_all_automators()
+    automators_html, sections_html = _render_automator_fragments(automators, await _automator_statuses(automators))
+    return {"automators_html": automators_html, "sections_html": sections_html}
+
+
+async def _render_automator_macros_page(automators: List[dict], statuses: Dict[str, dict]) -> str:
+    """Render the Automator Controls page."""
+    automator_items_html, all_sections_html = _render_automator_fragments(automators, statuses)
+
+    automator_management = f"""
+    <div class="section">
+        <h2>Automator Connections</h2>
+        <p style="color: #888888; margin-bottom: 20px;">Configure connections to your Cuez Automator instances.</p>
+        <div class="item-list" id="automator-list">
+            {automator_items_html}
+        </div>
+
+        <div id="automator-form" style="display: none; margin-top: 20px; padding: 20px; background: #1e1e1e; border-radius: 8px; border: 1px solid #333;">
+            <h3 style="margin-top: 0;" id="automator-form-title">Add Automator</h3>
+            <input type="hidden" id="automator-edit-id">
+            <div style="margin-bottom: 15px;">
+                <label style="display: block; margin-bottom: 5px; font-weight: 600;">Name</label>
+                <input type="text" id="automator-name" placeholder="e.g., Primary Automator" style="width: 100%; padding: 10px; font-size: 14px; border-radius: 6px;">
+            </div>
+            <div style="margin-bottom: 15px;">
+                <label style="display: block; margin-bottom: 5px; font-weight: 600;">API URL</label>
+                <input type="text" id="automator-url" placeholder="http://127.0.0.1:7070" style="width: 100%; padding: 10px; font-size: 14px; border-radius: 6px;">
+            </div>
+            <div style="display: flex; gap: 10px;">
+                <button class="primary" onclick="saveAutomator()">Save</button>
+                <button class="secondary" onclick="cancelAutomatorForm()">Cancel</button>
+            </div>
+        </div>
+
+        <button class="primary mt-20" onclick="showAddAutomatorForm()" id="add-automator-btn">Add Automator</button>
+        <div id="automator-status" style="margin-top: 16px;"></div>
+    </div>
+    """
 
     macros_section = f"""
     <div class="section">
@@ -2478,10 +3143,12 @@ async def automator_macros_page():
         <p style="color: #888888; margin-bottom: 12px;">All items from all Automators organized by type. Use search to filter across everything.</p>
 
         <div style="margin-bottom: 20px;">
-            <input type="text" id="searchBox" placeholder="Search across all automators and items..." style="width: 100%; padding: 10px 14px; font-size: 14px; border-radius: 8px;" oninput="filterItems()">
+            <input type="text" id="searchBox" placeholder="Search across all automators and items..." style="width: 100%; padding: 10px 14px; font-size: 14px; border-radius: 8px;" oninput="filterItemsDebounced()">
         </div>
 
-        {all_sections_html}
+        <div id="automator-sections">
+            {all_sections_html}
+        </div>
 
         <button class="secondary mt-20" onclick="refreshAllAutomators()">Refresh All Automators</button>
         <div id="refreshStatus" class="mt-20"></div>
@@ -2490,6 +3157,14 @@ async def automator_macros_page():
 
     content = automator_management + macros_section + f"""
     <script>
+        // Swap in the re-rendered cards and item sections returned by the API instead of reloading the page
+        function showAutomators(data) {{
+            document.getElementById('automator-list').innerHTML = data.automators_html;
+            document.getElementById('automator-sections').innerHTML = data.sections_html;
+            itemSearchIndex = buildItemSearchIndex();
+            filterItems();
+        }}
+
         // Automator Management Functions
         function showAddAutomatorForm() {{
             document.getElementById('automator-form').style.display = 'block';
@@ -2546,7 +3221,8 @@ async def automator_macros_page():
                 }});
 
                 if (response.ok) {{
-                    location.reload();
+                    cancelAutomatorForm();
+                    showAutomators(await response.json());
                 }} else {{
                     const error = await response.json();
                     const statusDiv = document.getElementById('automator-status');
@@ -2602,7 +3278,8 @@ async def automator_macros_page():
                 }});
 
                 if (response.ok) {{
-                    location.reload();
+                    cancelAutomatorForm();
+                    showAutomators(await response.json());
                 }} else {{
                     const error = await response.json();
                     const statusDiv = document.getElementById('automator-status');
@@ -2638,7 +3315,7 @@ async def automator_macros_page():
                 }});
 
                 if (response.ok) {{
-                    location.reload();
+                    showAutomators(await response.json());
                 }} else {{
                     const statusDiv = document.getElementById('automator-status');
                     statusDiv.innerHTML = '<div class="alert error">Error toggling Automator</div>';
@@ -2661,7 +3338,7 @@ async def automator_macros_page():
                 const confirmResponse = await fetch(`/api/automators/${{automatorId}}/delete?delete_mappings=true`, {{method: 'POST'}});
 
                 if (confirmResponse.ok) {{
-                    location.reload();
+                    showAutomators(await confirmResponse.json());
                 }} else {{
                     const statusDiv = document.getElementById('automator-status');
                     statusDiv.innerHTML = '<div class="alert error">Error deleting Automator</div>';
@@ -2672,7 +3349,7 @@ async def automator_macros_page():
                 const confirmResponse = await fetch(`/api/automators/${{automatorId}}/delete?delete_mappings=false`, {{method: 'POST'}});
 
                 if (confirmResponse.ok) {{
-                    location.reload();
+                    showAutomators(await confirmResponse.json());
                 }} else {{
                     const statusDiv = document.getElementById('automator-status');
                     statusDiv.innerHTML = '<div class="alert error">Error deleting Automator</div>';
@@ -2703,193 +3380,141 @@ async def automator_macros_page():
 
                 let successCount = 0;
                 let totalCount = automators.length;
+                let latest = null;
 
                 for (const auto of automators) {{
-                    const refreshResponse = await fetch(`/api/automator/refresh?automator_id=${{auto.id}}`, {{method: 'POST'}});
-                    const result = await refreshResponse.json();
-                    if (result.ok) {{
-                        successCount++;
-                    }}
-                }}
-
-                if (successCount === totalCount) {{
-                    status.innerHTML = `<div class="alert success">Successfully refreshed all ${{totalCount}} Automator(s)</div>`;
-                    setTimeout(() => location.reload(), 1000);
-                }} else {{
-                    status.innerHTML = `<div class="alert warning">Refreshed ${{successCount}} of ${{totalCount}} Automator(s)</div>`;
-                    setTimeout(() => location.reload(), 2000);
-                }}
-            }} catch (e) {{
-                status.innerHTML = `<div class="alert error">Error: ${{e.message}}</div>`;
-            }}
-        }}
-
-        function filterItems() {{
-            const searchTerm = document.getElementById('searchBox').value.toLowerCase();
-            const items = document.querySelectorAll('.searchable-item');
-
-            items.forEach(item => {{
-                const itemName = item.getAttribute('data-name');
-                const matches = itemName.includes(searchTerm);
-
-                if (matches) {{
-                    item.style.display = 'flex';
-                }} else {{
-                    item.style.display = 'none';
-                }}
-            }});
-
-            // Auto-expand sections that have matching items when searching
-            if (searchTerm) {{
-                document.querySelectorAll('details').forEach(detail => {{
-                    const hasVisibleItems = detail.querySelectorAll('.searchable-item[style*="display: flex"]').length > 0;
-                    if (hasVisibleItems) {{
-                        detail.setAttribute('open', '');
-                    }}
-                }});
-            }}
-        }}
-    </script>
-    """
-
-    return _get_base_html("Automator Controls", content, "automator")
-
-
-@app.get("/command-mapping", response_class=HTMLResponse)
-async def command_mapping_page():
-    """Command Mapping page."""
-    global config_data
-
-    tcp_commands = config_data.get("tcp_commands", [])
-    mappings = config_data.get("command_mappings", [])
-    automators = get_all_automators()
-
-    if not tcp_commands:
-        content = """
-        <h1>Command Mapping</h1>
-        <div class="alert info">
-            No TCP commands configured. Please add TCP commands first on the
-            <a href="/tcp-commands" style="color: #00bcd4;">TCP Commands page</a>.
-        </div>
-        """
-        return _get_base_html("Command Mapping", content, "mapping")
-
-    if len(automators) == 0:
-        content = """
-        <h1>Command Mapping</h1>
-        <div class="alert info">
-            No Automators configured. Please configure Automator integration on the
-            <a href="/automator-macros" style="color: #00bcd4;">Automator Controls page</a>.
-        </div>
-        """
-        return _get_base_html("Command Mapping", content, "mapping")
-
-    # Collect all macros from all Automators
-    all_macros = []
-    for auto in automators:
-        auto_id = auto["id"]
-        auto_name = auto["name"]
-        macros = fetch_automator_macros(auto_id)
-        for macro in macros:
-            macro["_automator_id"] = auto_id
-            macro["_automator_name"] = auto_name
-            all_macros.append(macro)
-
-    # Build mapping table
-    table_rows = ""
-    for tcp_cmd in tcp_commands:
-        tcp_id = tcp_cmd["id"]
-        tcp_name = tcp_cmd["name"]
-        tcp_trigger = tcp_cmd["tcp_trigger"]
+                    const refreshResponse = await fetch(`/api/automator/refresh?automator_id=${{auto.id}}`, {{method: 'POST'}});
+                    const result = await refreshResponse.json();
+                    if (result.ok) {{
+                        successCount++;
+                        latest = result;
+                    }}
+                }}
 
-        # Find current mapping
-        current_mapping = None
-        for m in mappings:
-            if m["tcp_command_id"] == tcp_id:
-                current_mapping = m
-                break
+                // Each successful refresh returns the whole page's markup, so the last one is current
+                if (latest) {{
+                    showAutomators(latest);
+                }}
 
-        # Get current automator_id and macro
-        current_automator_id = current_mapping.get("automator_id", "") if current_mapping else ""
-        current_automator_name = ""
-        if current_automator_id:
-            for auto in automators:
-                if auto["id"] == current_automator_id:
-                    current_automator_name = auto["name"]
-                    break
+                if (successCount === totalCount) {{
+                    status.innerHTML = `<div class="alert success">Successfully refreshed all ${{totalCount}} Automator(s)</div>`;
+                    setTimeout(() => status.innerHTML = '', 3000);
+                }} else {{
+                    status.innerHTML = `<div class="alert warning">Refreshed ${{successCount}} of ${{totalCount}} Automator(s)</div>`;
+                }}
+            }} catch (e) {{
+                status.innerHTML = `<div class="alert error">Error: ${{e.message}}</div>`;
+            }}
+        }}
 
-        current_macro_id = current_mapping.get("automator_macro_id", "") if current_mapping else ""
-        current_macro_name = current_mapping.get("automator_macro_name", "") if current_mapping else ""
-        current_item_type = current_mapping.get("item_type", "macro") if current_mapping else "macro"
+        // One click listener per container; the markup inside is swapped by showAutomators()
+        const automatorActions = {{toggle: toggleAutomator, edit: editAutomator, delete: deleteAutomator}};
+        document.getElementById('automator-list').addEventListener('click', e => {{
+            const button = e.target.closest('button[data-action]');
+            if (!button) return;
+            const card = button.closest('[data-automator-id]');
+            automatorActions[button.dataset.action](card.dataset.automatorId, card.dataset.automatorName);
+        }});
+        document.getElementById('automator-sections').addEventListener('click', e => {{
+            const link = e.target.closest('[data-action="test"]');
+            if (!link) return;
+            const item = link.closest('.searchable-item');
+            testMacro(item.dataset.id, item.querySelector('.item-title').textContent, item.dataset.type, item.dataset.automator);
+        }});
+
+        const itemSections = document.getElementsByTagName('details');
+
+        // Item names are read once per render instead of on every keystroke
+        function buildItemSearchIndex() {{
+            return Array.from(document.getElementsByClassName('searchable-item'), el => ({{
+                el,
+                hay: el.dataset.name
+            }}));
+        }}
+        let itemSearchIndex = buildItemSearchIndex();
 
-        # Build current display value with automator name
-        if current_macro_name and current_automator_name:
-            type_label = f" [{current_item_type}]" if current_item_type else ""
-            current_value = f"{current_automator_name}: {current_macro_name}{type_label}"
-        else:
-            current_value = ""
+        function filterItems() {{
+            const searchTerm = document.getElementById('searchBox').value.toLowerCase();
 
-        # Build datalist with ALL macros from ALL Automators
-        options_html = ""
-        for macro in all_macros:
-            macro_id = macro.get("id", "")
-            macro_name = macro.get("title", macro.get("name", "Unknown"))
-            macro_type = macro.get("type", "")
-            auto_name = macro.get("_automator_name", "")
-            type_label_opt = f" [{macro_type}]" if macro_type else ""
-            display_text = f"{auto_name}: {macro_name}{type_label_opt}"
-            options_html += f'<option value="{display_text}" data-automator-id="{macro.get("_automator_id", "")}" data-id="{macro_id}" data-type="{macro_type}">'
-
-        table_rows += f"""
-        <tr class="searchable-mapping-row" data-tcp-name="{tcp_name.lower()}" data-tcp-trigger="{tcp_trigger.lower()}" data-automator-name="{current_value.lower()}">
-            <td><strong>{tcp_name}</strong><br><span style="color: #888888; font-size: 12px;">{tcp_trigger}</span></td>
-            <td>
-                <input list="macros-{tcp_id}" class="mapping-input" data-tcp-id="{tcp_id}" value="{current_value}"
-                       placeholder="Type to search all Automator items..." style="width: 100%; padding: 8px;" onchange="saveMapping('{tcp_id}')">
-                <datalist id="macros-{tcp_id}">
-                    {options_html}
-                </datalist>
-            </td>
-            <td style="text-align: center; vertical-align: middle;">
-                <button class="play-btn" onclick="testMapping('{tcp_id}')" title="Test this mapping">▶</button>
-            </td>
-        </tr>
-        """
+            itemSearchIndex.forEach(({{el, hay}}) => el.classList.toggle('hide', !hay.includes(searchTerm)));
 
-    content = f"""
-    <h1>Command Mapping</h1>
+            // Auto-expand sections that have matching items when searching
+            if (searchTerm) {{
+                for (let i = 0; i < itemSections.length; i++) {{
+                    if (itemSections[i].querySelector('.searchable-item:not(.hide)')) {{
+                        itemSections[i].setAttribute('open', '');
+                    }}
+                }}
+            }}
+        }}
+        const filterItemsDebounced = debounce(filterItems, 120);
+    </script>
+    """
 
-    <div class="section">
-        <h2>Map TCP Commands to Automator Macros</h2>
-        <p style="color: #888888; margin-bottom: 20px;">
-            Link incoming TCP commands to trigger specific Automator macros.
-        </p>
+    return _get_base_html("Automator Controls", content, "automator")
 
-        <div style="margin-bottom: 20px;">
-            <input type="text" id="mappingSearchBox" placeholder="Search mappings by TCP command or Automator item name..." style="width: 100%; padding: 10px 14px; font-size: 14px; border-radius: 8px;" oninput="filterMappings()">
-        </div>
 
-        <div class="mapping-grid">
-            <table class="mapping-table">
-                <thead>
-                    <tr>
-                        <th style="width: 25%;">TCP Command</th>
-                        <th style="width: 65%;">Automator & Macro</th>
-                        <th style="text-align: center; width: 10%;">Test</th>
-                    </tr>
-                </thead>
-                <tbody id="mappings-tbody">
-                    {table_rows}
-                </tbody>
-            </table>
-        </div>
-    </div>
+@app.get("/command-mapping", response_class=HTMLResponse)
+async def command_mapping_page(request: Request):
+    """Command Mapping page (re-rendered only when config or cached Automator data changes)."""
+    key = _page_key("command-mapping")
+    page = _page_cache.get(key)
+    if page is None:
+        page = _page_cache[key] = await _render_command_mapping_page()
+    return _etag_response(request, page)
 
-    <div id="mappingStatus" class="mt-20"></div>
 
+# Static script for the Command Mapping page; only the two embedded JSON payloads vary
+_MAPPING_SCRIPT_TEMPLATE = """\
     <script>
         // All macros from all Automators
-        const allMacros = {json.dumps(all_macros)};
+        const allMacros = {macros_json};
+
+        // Text shown in the item picker and matched when saving: "Automator: Item [type]"
+        function itemDisplayText(m) {{
+            const type_label = m.type ? ` [${{m.type}}]` : '';
+            return `${{m._automator_name || ''}}: ${{m.title || m.name || ''}}${{type_label}}`;
+        }}
+
+        // Display text -> item, built on first lookup
+        let itemsByDisplay = null;
+
+        function findItem(displayValue) {{
+            if (!itemsByDisplay) {{
+                itemsByDisplay = new Map();
+                for (const m of allMacros) {{
+                    const fullDisplay = itemDisplayText(m);
+                    // First match wins, as with the linear search this replaces
+                    if (!itemsByDisplay.has(fullDisplay)) {{
+                        itemsByDisplay.set(fullDisplay, m);
+                    }}
+                }}
+            }}
+            return itemsByDisplay.get(displayValue);
+        }}
+
+        // Fill the shared item picker from the embedded list, attaching all options in one go
+        function fillItemDatalist() {{
+            const frag = document.createDocumentFragment();
+            for (const m of allMacros) {{
+                const option = document.createElement('option');
+                option.value = itemDisplayText(m);
+                frag.appendChild(option);
+            }}
+            document.getElementById('automator-items').replaceChildren(frag);
+        }}
+
+        // The picker is only needed once an input is used, so build it on first interaction
+        let itemDatalistFilled = false;
+        function ensureItemDatalist() {{
+            if (!itemDatalistFilled) {{
+                itemDatalistFilled = true;
+                fillItemDatalist();
+            }}
+        }}
+        const mappingsBody = document.getElementById('mappings-tbody');
+        mappingsBody.addEventListener('pointerdown', ensureItemDatalist);
+        mappingsBody.addEventListener('focusin', ensureItemDatalist);
 
         async function saveMapping(tcpId) {{
             const input = document.querySelector(`input[data-tcp-id="${{tcpId}}"]`);
@@ -2905,14 +3530,7 @@ async def command_mapping_page():
             }}
 
             // Find the macro by matching the display text
-            const macro = allMacros.find(m => {{
-                const macroName = m.title || m.name || '';
-                const macroType = m.type || '';
-                const autoName = m._automator_name || '';
-                const type_label = macroType ? ` [${{macroType}}]` : '';
-                const fullDisplay = `${{autoName}}: ${{macroName}}${{type_label}}`;
-                return fullDisplay === displayValue;
-            }});
+            const macro = findItem(displayValue);
 
             if (!macro) {{
                 status.innerHTML = '<div class="alert error">Please select a valid item from the list</div>';
@@ -2933,26 +3551,18 @@ async def command_mapping_page():
         async function testMapping(tcpId) {{
             const input = document.querySelector(`input[data-tcp-id="${{tcpId}}"]`);
             const displayValue = input.value.trim();
+            const status = document.getElementById('mappingStatus');
 
             if (!displayValue) {{
-                const status = document.getElementById('mappingStatus');
                 status.innerHTML = '<div class="alert error">No mapping configured for this command</div>';
                 setTimeout(() => status.innerHTML = '', 3000);
                 return;
             }}
 
             // Find the macro and automator
-            const macro = allMacros.find(m => {{
-                const macroName = m.title || m.name || '';
-                const macroType = m.type || '';
-                const autoName = m._automator_name || '';
-                const type_label = macroType ? ` [${{macroType}}]` : '';
-                const fullDisplay = `${{autoName}}: ${{macroName}}${{type_label}}`;
-                return fullDisplay === displayValue;
-            }});
+            const macro = findItem(displayValue);
 
             if (!macro) {{
-                const status = document.getElementById('mappingStatus');
                 status.innerHTML = '<div class="alert error">Invalid mapping</div>';
                 setTimeout(() => status.innerHTML = '', 3000);
                 return;
@@ -2976,66 +3586,17 @@ async def command_mapping_page():
             }}
         }}
 
-        async function saveAllMappings() {{
-            const inputs = document.querySelectorAll('.mapping-input');
-            const newMappings = [];
-
-            for (const input of inputs) {{
-                const tcpId = input.dataset.tcpId;
-                const displayValue = input.value.trim();
-
-                if (displayValue) {{
-                    // Find the macro by matching the display text
-                    const macro = macros.find(m => {{
-                        const type_label = m.type ? ` [${{m.type}}]` : '';
-                        return ((m.title || m.name || '') + type_label) === displayValue;
-                    }});
-
-                    if (macro) {{
-                        newMappings.push({{
-                            tcp_command_id: tcpId,
-                            automator_macro_id: macro.id,
-                            automator_macro_name: macro.title || macro.name || '',
-                            automator_macro_type: macro.type || 'macro'
-                        }});
-                    }}
-                }}
-            }}
-
-            const response = await fetch('/api/config', {{
-                method: 'POST',
-                headers: {{'Content-Type': 'application/json'}},
-                body: JSON.stringify({{command_mappings: newMappings}})
-            }});
-
-            const status = document.getElementById('mappingStatus');
-            if (response.ok) {{
-                status.innerHTML = '<div class="alert success">All mappings saved successfully!</div>';
-                setTimeout(() => status.innerHTML = '', 3000);
-            }} else {{
-                status.innerHTML = '<div class="alert error">Error saving mappings.</div>';
-            }}
-        }}
-
         async function updateMapping(tcpId, automatorId, macroId, macroName, macroType) {{
-            const currentMappings = {json.dumps(mappings)};
-
-            // Remove existing mapping for this TCP command
-            const filteredMappings = currentMappings.filter(m => m.tcp_command_id !== tcpId);
-
-            // Add new mapping with automator_id
-            filteredMappings.push({{
-                tcp_command_id: tcpId,
-                automator_id: automatorId,
-                automator_macro_id: macroId,
-                automator_macro_name: macroName,
-                item_type: macroType
-            }});
-
-            const response = await fetch('/api/config', {{
-                method: 'POST',
+            const response = await fetch(`/api/mappings/${{encodeURIComponent(tcpId)}}`, {{
+                method: 'PUT',
                 headers: {{'Content-Type': 'application/json'}},
-                body: JSON.stringify({{command_mappings: filteredMappings}})
+                body: JSON.stringify({{
+                    tcp_command_id: tcpId,
+                    automator_id: automatorId,
+                    automator_macro_id: macroId,
+                    automator_macro_name: macroName,
+                    item_type: macroType
+                }})
             }});
 
             const status = document.getElementById('mappingStatus');
@@ -3048,13 +3609,8 @@ async def command_mapping_page():
         }}
 
         async function removeMappingForTcpCommand(tcpId) {{
-            const currentMappings = {json.dumps(mappings)};
-            const filteredMappings = currentMappings.filter(m => m.tcp_command_id !== tcpId);
-
-            const response = await fetch('/api/config', {{
-                method: 'POST',
-                headers: {{'Content-Type': 'application/json'}},
-                body: JSON.stringify({{command_mappings: filteredMappings}})
+            const response = await fetch(`/api/mappings/${{encodeURIComponent(tcpId)}}`, {{
+                method: 'DELETE'
             }});
 
             const status = document.getElementById('mappingStatus');
@@ -3064,14 +3620,17 @@ async def command_mapping_page():
             }}
         }}
 
+        // Live collection: looked up once, stays current if rows change
+        const mappingRows = document.getElementsByClassName('searchable-mapping-row');
+
         function filterMappings() {{
             const searchTerm = document.getElementById('mappingSearchBox').value.toLowerCase();
-            const rows = document.querySelectorAll('.searchable-mapping-row');
 
-            rows.forEach(row => {{
-                const tcpName = row.getAttribute('data-tcp-name');
-                const tcpTrigger = row.getAttribute('data-tcp-trigger');
-                const automatorName = row.getAttribute('data-automator-name');
+            for (let i = 0; i < mappingRows.length; i++) {{
+                const row = mappingRows[i];
+                const tcpName = row.dataset.tcpName;
+                const tcpTrigger = row.dataset.tcpTrigger;
+                const automatorName = row.dataset.automatorName;
                 const matches = tcpName.includes(searchTerm) || tcpTrigger.includes(searchTerm) || automatorName.includes(searchTerm);
 
                 if (matches) {{
@@ -3079,10 +3638,138 @@ async def command_mapping_page():
                 }} else {{
                     row.style.display = 'none';
                 }}
-            }});
+            }}
         }}
+        const filterMappingsDebounced = debounce(filterMappings, 120);
     </script>
-    """
+"""
+
+
+async def _render_command_mapping_page() -> str:
+    """Render the Command Mapping page."""
+    global config_data
+
+    tcp_commands = config_data.get("tcp_commands", [])
+    mappings = config_data.get("command_mappings", [])
+    automators = get_all_automators()
+
+    if not tcp_commands:
+        content = """
+        <h1>Command Mapping</h1>
+        <div class="alert info">
+            No TCP commands configured. Please add TCP commands first on the
+            <a href="/tcp-commands" style="color: #00bcd4;">TCP Commands page</a>.
+        </div>
+        """
+        return _get_base_html("Command Mapping", content, "mapping")
+
+    if len(automators) == 0:
+        content = """
+        <h1>Command Mapping</h1>
+        <div class="alert info">
+            No Automators configured. Please configure Automator integration on the
+            <a href="/automator-macros" style="color: #00bcd4;">Automator Controls page</a>.
+        </div>
+        """
+        return _get_base_html("Command Mapping", content, "mapping")
+
+    # Collect all macros from all Automators straight from the in-memory cache,
+    # tagging copies so the cached items (and the cache file) stay untouched
+    all_macros = [
+        {**macro, "_automator_id": auto["id"], "_automator_name": auto["name"]}
+        for auto in automators
+        for macro in _get_cached_items(auto["id"])
+    ]
+
+    # Index mappings and Automator names once instead of scanning them for every row
+    mapping_by_command = {}
+    for m in mappings:
+        mapping_by_command.setdefault(m["tcp_command_id"], m)
+    automator_names = {auto["id"]: auto["name"] for auto in automators}
+
+    # Build mapping table
+    rows = []
+    rows_append = rows.append
+    for tcp_cmd in tcp_commands:
+        tcp_id = tcp_cmd["id"]
+        tcp_name = tcp_cmd["name"]
+        tcp_trigger = tcp_cmd["tcp_trigger"]
+
+        # Find current mapping
+        current_mapping = mapping_by_command.get(tcp_id)
+
+        # Get current automator_id and macro
+        current_automator_id = current_mapping.get("automator_id", "") if current_mapping else ""
+        current_automator_name = automator_names.get(current_automator_id, "") if current_automator_id else ""
+
+        current_macro_id = current_mapping.get("automator_macro_id", "") if current_mapping else ""
+        current_macro_name = current_mapping.get("automator_macro_name", "") if current_mapping else ""
+        current_item_type = current_mapping.get("item_type", "macro") if current_mapping else "macro"
+
+        # Build current display value with automator name
+        if current_macro_name and current_automator_name:
+            type_label = f" [{current_item_type}]" if current_item_type else ""
+            current_value = f"{current_automator_name}: {current_macro_name}{type_label}"
+        else:
+            current_value = ""
+
+        # Escape each value once; escaped entities are lowercase, so lowering afterwards is safe
+        tcp_id_h = escape(tcp_id)
+        tcp_id_js = _js_attr(tcp_id)
+        tcp_name_h = escape(tcp_name)
+        tcp_trigger_h = escape(tcp_trigger)
+        current_value_h = escape(current_value)
+        rows_append(f"""
+        <tr class="searchable-mapping-row" data-tcp-name="{tcp_name_h.lower()}" data-tcp-trigger="{tcp_trigger_h.lower()}" data-automator-name="{current_value_h.lower()}">
+            <td><strong>{tcp_name_h}</strong><br><span style="color: #888888; font-size: 12px;">{tcp_trigger_h}</span></td>
+            <td>
+                <input list="automator-items" class="mapping-input" data-tcp-id="{tcp_id_h}" value="{current_value_h}"
+                       placeholder="Type to search all Automator items..." style="width: 100%; padding: 8px;" onchange="saveMapping({tcp_id_js})">
+            </td>
+            <td style="text-align: center; vertical-align: middle;">
+                <button class="play-btn" onclick="testMapping({tcp_id_js})" title="Test this mapping">▶</button>
+            </td>
+        </tr>
+        """)
+    table_rows = "".join(rows)
+
+    script = _MAPPING_SCRIPT_TEMPLATE.format_map({
+        "macros_json": _script_json_parse(all_macros),
+    })
+
+    content = f"""
+    <h1>Command Mapping</h1>
+
+    <div class="section">
+        <h2>Map TCP Commands to Automator Macros</h2>
+        <p style="color: #888888; margin-bottom: 20px;">
+            Link incoming TCP commands to trigger specific Automator macros.
+        </p>
+
+        <div style="margin-bottom: 20px;">
+            <input type="text" id="mappingSearchBox" placeholder="Search mappings by TCP command or Automator item name..." style="width: 100%; padding: 10px 14px; font-size: 14px; border-radius: 8px;" oninput="filterMappingsDebounced()">
+        </div>
+
+        <div class="mapping-grid">
+            <table class="mapping-table">
+                <thead>
+                    <tr>
+                        <th style="width: 25%;">TCP Command</th>
+                        <th style="width: 65%;">Automator & Macro</th>
+                        <th style="text-align: center; width: 10%;">Test</th>
+                    </tr>
+                </thead>
+                <tbody id="mappings-tbody">
+                    {table_rows}
+                </tbody>
+            </table>
+            <datalist id="automator-items"></datalist>
+        </div>
+    </div>
+
+    <div id="mappingStatus" class="mt-20"></div>
+
+{script}    """
 
     return _get_base_html("Command Mapping", content, "mapping")
 
@@ -3257,7 +3944,7 @@ async def api_status():
             "name": listener["name"],
             "enabled": listener["enabled"],
             "running": port in tcp_servers,
-            "connections": len(tcp_connections.get(port, []))
+            "connections": len(tcp_connections.get(port, {}))
         }
 
     return {
@@ -3270,18 +3957,19 @@ async def api_status():
 @app.get("/api/automator/test")
 async def api_automator_test(automator_id: Optional[str] = None):
     """Test Automator connection."""
-    return check_automator_connection(automator_id)
+    return await check_automator_connection(automator_id, max_age=0)
 
 
 @app.post("/api/automator/refresh")
 async def api_automator_refresh(automator_id: Optional[str] = None):
     """Force refresh Automator data from API."""
     try:
-        items = fetch_automator_macros(automator_id, force_refresh=True)
+        items = await fetch_automator_macros(automator_id, force_refresh=True)
         return {
             "ok": True,
             "count": len(items),
-            "message": f"Loaded {len(items)} items"
+            "message": f"Loaded {len(items)} items",
+            **await _automator_fragments(),
         }
     except Exception as e:
         return {
@@ -3321,12 +4009,14 @@ async def api_add_automator(automator: AutomatorConfig):
     if any(a["id"] == automator.id for a in automators):
         raise HTTPException(400, "Automator ID already exists")
 
-    automators.append(automator.dict())
+    entry = automator.model_dump()
+    automators.append(entry)
     config_data["automators"] = automators
-    save_config(config_data)
+    _rebuild_dispatch_indexes()
+    await save_config_async(config_data)
 
     log_event("Config", f"Added Automator: {automator.name}")
-    return {"success": True, "automator": automator.dict()}
+    return {"success": True, "automator": entry, **await _automator_fragments()}
 
 
 @app.put("/api/automators/{automator_id}")
@@ -3335,11 +4025,12 @@ async def api_update_automator(automator_id: str, automator: AutomatorConfig):
     global config_data
 
     automators = config_data.get("automators", [])
+    entry = automator.model_dump()
     found = False
 
     for i, a in enumerate(automators):
         if a["id"] == automator_id:
-            automators[i] = automator.dict()
+            automators[i] = entry
             found = True
             break
 
@@ -3347,10 +4038,11 @@ async def api_update_automator(automator_id: str, automator: AutomatorConfig):
         raise HTTPException(404, "Automator not found")
 
     config_data["automators"] = automators
-    save_config(config_data)
+    _rebuild_dispatch_indexes()
+    await save_config_async(config_data)
 
     log_event("Config", f"Updated Automator: {automator.name}")
-    return {"success": True, "automator": automator.dict()}
+    return {"success": True, "automator": entry, **await _automator_fragments()}
 
 
 @app.delete("/api/automators/{automator_id}")
@@ -3391,10 +4083,45 @@ async def api_delete_automator_confirm(automator_id: str, delete_mappings: bool
         config_data["command_mappings"] = [m for m in mappings if m.get("automator_id") != automator_id]
         deleted_count = old_count - len(config_data["command_mappings"])
 
-    save_config(config_data)
+    _rebuild_dispatch_indexes()
+    await save_config_async(config_data)
     log_event("Config", f"Deleted Automator: {automator_id} ({deleted_count} mappings removed)")
 
-    return {"success": True, "deleted_mappings": deleted_count}
+    return {"success": True, "deleted_mappings": deleted_count, **await _automator_fragments()}
+
+
+@app.put("/api/mappings/{tcp_command_id}")
+async def api_set_mapping(tcp_command_id: str, mapping: CommandMapping):
+    """Create or replace the mapping for a single TCP command."""
+    global config_data
+
+    mapping.tcp_command_id = tcp_command_id
+    mappings = config_data.get("command_mappings", [])
+    config_data["command_mappings"] = [m for m in mappings if m["tcp_command_id"] != tcp_command_id]
+    entry = mapping.model_dump()
+    config_data["command_mappings"].append(entry)
+
+    _rebuild_dispatch_indexes()
+    await save_config_async(config_data)
+    log_event("Config", f"Mapped TCP command {tcp_command_id} to {mapping.automator_macro_name or mapping.automator_macro_id}")
+
+    return {"success": True, "mapping": entry}
+
+
+@app.delete("/api/mappings/{tcp_command_id}")
+async def api_delete_mapping(tcp_command_id: str):
+    """Remove the mapping for a single TCP command."""
+    global config_data
+
+    mappings = config_data.get("command_mappings", [])
+    config_data["command_mappings"] = [m for m in mappings if m["tcp_command_id"] != tcp_command_id]
+    deleted_count = len(mappings) - len(config_data["command_mappings"])
+
+    _rebuild_dispatch_indexes()
+    await save_config_async(config_data)
+    log_event("Config", f"Removed mapping for TCP command {tcp_command_id}")
+
+    return {"success": True, "deleted": deleted_count}
 
 
 @app.post("/api/config")
@@ -3402,45 +4129,77 @@ async def api_update_config(config_update: ConfigUpdate):
     """Update configuration."""
     global config_data
 
-    # Update config
-    if config_update.tcp_listeners is not None:
-        config_data["tcp_listeners"] = [l.dict() for l in config_update.tcp_listeners]
-        log_event("Config", f"Updated TCP listeners ({len(config_update.tcp_listeners)} listeners)")
+    # Dump the validated body in one pass; unset (None) sections are left out
+    updates = config_update.model_dump(exclude_none=True)
 
-    if config_update.tcp_commands is not None:
-        config_data["tcp_commands"] = [c.dict() for c in config_update.tcp_commands]
-        log_event("Config", f"Updated TCP commands ({len(config_update.tcp_commands)} commands)")
+    # Update config
+    if "tcp_listeners" in updates:
+        config_data["tcp_listeners"] = updates["tcp_listeners"]
+        log_event("Config", f"Updated TCP listeners ({len(updates['tcp_listeners'])} listeners)")
+
+    if "tcp_commands" in updates:
+        config_data["tcp_commands"] = updates["tcp_commands"]
+        log_event("Config", f"Updated TCP commands ({len(updates['tcp_commands'])} commands)")
+
+    if "update_tcp_command" in updates:
+        command = updates["update_tcp_command"]
+        commands = config_data.setdefault("tcp_commands", [])
+        for i, existing in enumerate(commands):
+            if existing["id"] == command["id"]:
+                commands[i] = command
+                break
+        else:
+            raise HTTPException(404, "TCP command not found")
+        updates["tcp_commands"] = commands
+        log_event("Config", f"Updated TCP command '{command['name']}'")
 
-    if config_update.automators is not None:
-        config_data["automators"] = [a.dict() for a in config_update.automators]
-        log_event("Config", f"Updated Automators ({len(config_update.automators)} configured)")
+    if "automators" in updates:
+        config_data["automators"] = updates["automators"]
+        log_event("Config", f"Updated Automators ({len(updates['automators'])} configured)")
 
-    if config_update.first_run is not None:
-        config_data["first_run"] = config_update.first_run
-        if not config_update.first_run:
+    if "first_run" in updates:
+        config_data["first_run"] = updates["first_run"]
+        if not updates["first_run"]:
             log_event("Config", "Welcome banner dismissed")
 
-    if config_update.command_mappings is not None:
-        config_data["command_mappings"] = [m.dict() for m in config_update.command_mappings]
-        log_event("Config", f"Updated command mappings ({len(config_update.command_mappings)} mappings)")
+    if "command_mappings" in updates:
+        config_data["command_mappings"] = updates["command_mappings"]
+        log_event("Config", f"Updated command mappings ({len(updates['command_mappings'])} mappings)")
 
-    if config_update.web_port is not None:
-        config_data["web_port"] = config_update.web_port
-        log_event("Config", f"Updated web port to {config_update.web_port}")
+    if "web_port" in updates:
+        config_data["web_port"] = updates["web_port"]
+        log_event("Config", f"Updated web port to {updates['web_port']}")
+
+    if "tcp_commands" in updates or "command_mappings" in updates or "automators" in updates:
+        _rebuild_dispatch_indexes()
 
     # Save config
-    save_config(config_data)
+    await save_config_async(config_data)
 
     # Restart TCP servers if listeners changed
-    if config_update.tcp_listeners is not None:
+    if "tcp_listeners" in updates:
         await restart_tcp_servers()
 
-    return {"success": True}
+    # Re-rendered lists let the TCP page update in place instead of reloading
+    result = {"success": True}
+    if "tcp_listeners" in updates:
+        result["tcp_listeners"] = config_data["tcp_listeners"]
+        result["listeners_html"] = _render_tcp_listeners_html(config_data["tcp_listeners"])
+    if "tcp_commands" in updates:
+        result["tcp_commands"] = config_data["tcp_commands"]
+        result["commands_html"] = _render_tcp_commands_html(config_data["tcp_commands"])
+    return result
 
 
 @app.get("/api/config")
-async def api_get_config():
-    """Get current configuration."""
+async def api_get_config(fields: Optional[str] = None):
+    """Get current configuration.
+
+    ?fields=command_mappings,automators returns only those top-level sections.
+    """
+    if fields:
+        keys = {key.strip() for key in fields.split(",")}
+        return {key: value for key, value in config_data.items() if key in keys}
     return config_data
 
 
@@ -3458,7 +4217,60 @@ async def health():
 @app.get("/events")
 async def get_events():
     """Get recent command/event log entries."""
-    return {"events": COMMAND_LOG[-100:]}
+    return {"events": recent_events(100)}
+
+
+def _count_log_lines(f, st: os.stat_result) -> Tuple[int, int]:
+    """Return (total_lines, size) for the open log, scanning only bytes appended since the last call.
+
+    The count is kept per file identity (rotation gives the log a new inode) and is
+    discarded if the file shrank or the bytes it ended on have changed.
+    """
+    global _log_line_count
+
+    counted, newlines, marker = 0, 0, b""
+    cached = _log_line_count
+    if cached and cached[0] == (st.st_dev, st.st_ino) and cached[1] <= st.st_size:
+        f.seek(cached[1] - len(cached[3]))
+        if f.read(len(cached[3])) == cached[3]:
+            _, counted, newlines, marker = cached
+
+    f.seek(counted)
+    for chunk in iter(lambda: f.read(1 << 20), b""):
+        newlines += chunk.count(b"\n")
+        marker = (marker + chunk[-LOG_COUNT_MARKER:])[-LOG_COUNT_MARKER:]
+    size = f.tell()
+
+    _log_line_count = ((st.st_dev, st.st_ino), size, newlines, marker)
+    # An unterminated final line still counts
+    return newlines + (marker[-1:] not in (b"", b"\n")), size
+
+
+def _read_log_tail(lines: int) -> Tuple[int, List[str]]:
+    """Return (total_lines, last_lines) for the log file, decoding only the tail.
+
+    The tail is read by seeking back from the end, doubling the window until it
+    holds enough lines.
+    """
+    with open(_log_file_path, 'rb') as f:
+        total_lines, size = _count_log_lines(f, os.fstat(f.fileno()))
+
+        if lines <= 0:
+            # Same slicing as the old readlines() version: 0 returns the whole log
+            f.seek(0)
+            all_lines = io.StringIO(f.read(size).decode('utf-8', 'replace'), newline=None).readlines()
+            return total_lines, all_lines[-lines:]
+
+        window = lines * LOG_TAIL_LINE_ESTIMATE
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            # StringIO(newline=None) splits lines exactly like reading in text mode
+            tail = io.StringIO(f.read(size - start).decode('utf-8', 'replace'), newline=None).readlines()
+            # Past the start of the file the first line may be cut off, so need one extra
+            if start == 0 or len(tail) > lines:
+                return total_lines, tail[-lines:]
+            window *= 2
 
 
 @app.get("/logs/export")
@@ -3467,21 +4279,12 @@ async def export_logs():
     if not _log_file_path.exists():
         raise HTTPException(status_code=404, detail="Log file not found")
 
-    try:
-        with open(_log_file_path, 'r', encoding='utf-8') as f:
-            log_content = f.read()
-
-        from fastapi.responses import Response
-        return Response(
-            content=log_content,
-            media_type="text/plain",
-            headers={
-                "Content-Disposition": f"attachment; filename=sony_automator_controls_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-            }
-        )
-    except Exception as e:
-        logger.error(f"Error reading log file: {e}")
-        raise HTTPException(status_code=500, detail=f"Error reading log file: {str(e)}")
+    # Streamed from disk in chunks rather than read into memory on the event loop
+    return FileResponse(
+        _log_file_path,
+        media_type="text/plain",
+        filename=f"sony_automator_controls_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    )
 
 
 @app.get("/logs/view")
@@ -3491,13 +4294,11 @@ async def view_logs(lines: int = 500):
         raise HTTPException(status_code=404, detail="Log file not found")
 
     try:
-        with open(_log_file_path, 'r', encoding='utf-8') as f:
-            all_lines = f.readlines()
-            last_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
+        total_lines, last_lines = await asyncio.get_running_loop().run_in_executor(None, _read_log_tail, lines)
 
         return {
             "log_file": str(_log_file_path),
-            "total_lines": len(all_lines),
+            "total_lines": total_lines,
             "showing_lines": len(last_lines),
             "logs": ''.join(last_lines)
         }
@@ -3509,7 +4310,10 @@ async def view_logs(lines: int = 500):
 @app.post("/tcp/capture/start")
 async def start_tcp_capture():
     """Start listening for the next TCP command."""
-    global tcp_capture_active, tcp_capture_result
+    global tcp_capture_active, tcp_capture_result, _capture_changed
+    if _capture_changed:
+        _capture_changed.set()  # Release waiters from any previous session
+    _capture_changed = asyncio.Event()
     tcp_capture_active = True
     tcp_capture_result = None
     log_event("TCP Capture", "Started listening for TCP command")
@@ -3517,9 +4321,19 @@ async def start_tcp_capture():
 
 
 @app.get("/tcp/capture/status")
-async def get_tcp_capture_status():
-    """Get current TCP capture status."""
+async def get_tcp_capture_status(wait: float = 0):
+    """Get current TCP capture status.
+
+    With wait > 0, a listening capture holds the request open for up to that many
+    seconds (capped at CAPTURE_MAX_WAIT) until a command arrives or capture is cancelled.
+    """
     global tcp_capture_active, tcp_capture_result
+    if wait > 0 and tcp_capture_active and not tcp_capture_result and _capture_changed:
+        try:
+            await asyncio.wait_for(_capture_changed.wait(), timeout=min(wait, CAPTURE_MAX_WAIT))
+        except asyncio.TimeoutError:
+            pass
+
     if tcp_capture_result:
         result = tcp_capture_result
         tcp_capture_result = None  # Clear after reading
@@ -3536,6 +4350,8 @@ async def cancel_tcp_capture():
     global tcp_capture_active, tcp_capture_result
     tcp_capture_active = False
     tcp_capture_result = None
+    if _capture_changed:
+        _capture_changed.set()
     log_event("TCP Capture", "Cancelled")
     return {"status": "cancelled"}
 
@@ -3564,7 +4380,7 @@ async def update_settings(settings: SettingsIn):
         config_data["first_run"] = settings.first_run
         log_event("CONFIG", f"First run status set to {settings.first_run}")
 
-    save_config(config_data)
+    await save_config_async(config_data)
 
     return {
         "ok": True,
@@ -3597,8 +4413,9 @@ async def import_config(config: Dict[str, Any]):
             config_data["automator"] = config["automator"]
         if "command_mappings" in config:
             config_data["command_mappings"] = config["command_mappings"]
+        _rebuild_dispatch_indexes()
 
-        save_config(config_data)
+        await save_config_async(config_data)
         log_event("CONFIG", "Configuration imported successfully")
 
         return {
@@ -3615,9 +4432,10 @@ async def check_version():
     """Check for updates against GitHub releases."""
     current = __version__
     try:
-        resp = requests.get(
+        client = _get_http_client()
+        resp = await client.get(
             "https://api.github.com/repos/BlueElliott/Elliotts-Sony-Automator-Controls/releases/latest",
-            timeout=5
+            follow_redirects=True
         )
         if resp.status_code == 404:
             return {
@@ -3643,7 +4461,7 @@ async def check_version():
             "release_url": release_url,
             "message": "You are up to date" if up_to_date else "A newer version is available",
         }
-    except requests.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:
         logger.error("Version check failed: %s", e)
         return {
             "current": current,
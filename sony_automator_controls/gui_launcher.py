@@ -679,16 +679,15 @@ class SonyAutomatorGUI:
 
         # Reload configuration
         try:
-            # Reload config from file
-            new_config = core.load_config()
-            self.config.update(new_config)
-            core.config_data.update(new_config)
+            # Reload config from file (the server's copy and the launcher's own)
+            core.reload_config()
+            self.config.update(core.load_config())
             print("[Restart] Configuration reloaded")
         except Exception as e:
             print(f"[Restart] Config reload error: {e}")
 
         # Clear event log
-        core.COMMAND_LOG.clear()
+        core.clear_events()
         print("[Restart] Event log cleared")
 
         # Reset runtime counter
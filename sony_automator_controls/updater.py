@@ -1,6 +1,6 @@
 """Auto-update functionality for Sony Automator Controls."""
 
-import requests
+import httpx
 import logging
 import os
 import sys
@@ -31,7 +31,7 @@ def check_for_updates() -> Optional[Dict]:
     """
     try:
         logger.info("Checking for updates...")
-        response = requests.get(GITHUB_API_URL, timeout=10)
+        response = httpx.get(GITHUB_API_URL, timeout=10, follow_redirects=True)
         response.raise_for_status()
 
         data = response.json()
@@ -82,21 +82,21 @@ def download_update(download_url: str, asset_name: str) -> Optional[Path]:
 
         download_path = temp_dir / asset_name
 
-        # Download with progress
-        response = requests.get(download_url, stream=True, timeout=60)
-        response.raise_for_status()
-
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded = 0
-
-        with open(download_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        progress = (downloaded / total_size) * 100
-                        logger.debug(f"Download progress: {progress:.1f}%")
+        # Download with progress (release assets redirect to a CDN)
+        with httpx.stream("GET", download_url, timeout=60, follow_redirects=True) as response:
+            response.raise_for_status()
+
+            total_size = int(response.headers.get('content-length', 0))
+            downloaded = 0
+
+            with open(download_path, 'wb') as f:
+                for chunk in response.iter_bytes(chunk_size=8192):
+                    if chunk:
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if total_size > 0:
+                            progress = (downloaded / total_size) * 100
+                            logger.debug("Download progress: %.1f%%", progress)
 
         logger.info(f"Download complete: {download_path}")
         return download_path
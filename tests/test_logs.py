@@ -0,0 +1,40 @@
+"""Tests for the /logs/view tail reader."""
+import pytest
+from fastapi.testclient import TestClient
+
+from sony_automator_controls import core
+
+
+LOG_LINES = [f"2026-01-01 00:00:{i:02d} - INFO - line {i}\n" for i in range(40)]
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    path = tmp_path / "sony_automator_controls.log"
+    path.write_text("".join(LOG_LINES), encoding="utf-8")
+    monkeypatch.setattr(core, "_log_file_path", path)
+    return path
+
+
+@pytest.mark.parametrize("lines", [1, 5, 39, 40, 500])
+def test_read_log_tail_returns_last_lines(log_file, lines):
+    assert core._read_log_tail(lines) == (len(LOG_LINES), LOG_LINES[-lines:])
+
+
+def test_read_log_tail_zero_returns_whole_log(log_file):
+    assert core._read_log_tail(0) == (len(LOG_LINES), LOG_LINES)
+
+
+def test_read_log_tail_counts_appended_lines(log_file):
+    core._read_log_tail(1)
+    with open(log_file, "a", encoding="utf-8") as f:
+        f.write("appended\nunterminated")
+    assert core._read_log_tail(2) == (len(LOG_LINES) + 2, ["appended\n", "unterminated"])
+
+
+def test_view_logs_zero_lines_returns_whole_log(log_file):
+    response = TestClient(core.app).get("/logs/view", params={"lines": 0})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_lines"] == body["showing_lines"] == len(LOG_LINES)
+    assert body["logs"] == "".join(LOG_LINES)